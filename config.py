@@ -1,8 +1,10 @@
 """
 Configuration Module
-Contains color palette and theme settings for Finsight application
+Contains color palette, theme settings and shared defaults for Finsight application
 """
 
+import os
+
 # Custom color palette inspired by Groww
 COLORS = {
     'primary': '#5367ff',  # Purple-blue
@@ -17,3 +19,42 @@ COLORS = {
     'invested': '#5367ff',  # Purple for invested
     'returns': '#00d09c',  # Teal for returns
 }
+
+# Local data directory for caches and snapshots
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".finsight")
+
+# Last-resort exchange rates vs USD (used only when no live or saved rates exist)
+FALLBACK_RATES = {
+    "USD": 1.0,
+    "EUR": 0.85,
+    "GBP": 0.73,
+    "JPY": 110.0,
+    "CAD": 1.25,
+    "AUD": 1.35,
+    "CHF": 0.92,
+    "CNY": 6.45,
+    "INR": 83.2,
+    "SGD": 1.35,
+    "KRW": 1300.0,
+    "BRL": 5.2,
+    "MXN": 17.5,
+    "RUB": 90.0,
+    "ZAR": 15.8
+}
+
+# Live price streaming: feed ("poll" = periodic batched quotes, "simulated" =
+# local random-walk stand-in), poll interval in seconds and UI drain period in ms
+LIVE_FEED = os.environ.get("FINSIGHT_LIVE_FEED", "poll")
+LIVE_POLL_INTERVAL = 15
+LIVE_FRAME_MS = 100
+
+# Financial news feeds (RSS or Atom, fetched concurrently), the timeout per
+# feed in seconds and the number of articles shown on the dashboard
+NEWS_FEEDS = [
+    {"name": "MarketWatch", "url": "https://feeds.marketwatch.com/marketwatch/realtimeheadlines/"},
+    {"name": "CNBC", "url": "https://search.cnbc.com/rs/search/combinedcms/view.xml?partnerId=wrss01&id=10000664"},
+    {"name": "Yahoo Finance", "url": "https://finance.yahoo.com/news/rssindex"},
+    {"name": "Economic Times", "url": "https://economictimes.indiatimes.com/markets/rssfeeds/1977021501.cms"},
+]
+NEWS_FEED_TIMEOUT = 8
+NEWS_LIMIT = 200
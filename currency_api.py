@@ -1,33 +1,29 @@
-import requests
 import json
+import numpy as np
+import sqlite3
+import threading
+import time
 from datetime import datetime
 
+from config import FALLBACK_RATES
+from finsight.core.fx import CrossRateMatrix, POPULAR_CURRENCIES
+from fetch_client import get_fetch_client
+from rate_store import RateSnapshotStore
+from rate_history import RateHistoryStore
+
 class CurrencyAPI:
     """Real-time currency converter using ExchangeRate-API"""
     
-    def __init__(self):
+    def __init__(self, ttl=600, store=None, history=None, client=None, retry_after=30):
         # Free API for exchange rates (no key required for basic usage)
         self.base_url = "https://api.exchangerate-api.com/v4/latest/"
         self.backup_url = "https://api.fxapi.com/latest?access_key=fxapi-your-key&base="
         
-        # Fallback rates (in case API is down)
-        self.fallback_rates = {
-            "USD": 1.0,
-            "EUR": 0.85,
-            "GBP": 0.73,
-            "JPY": 110.0,
-            "CAD": 1.25,
-            "AUD": 1.35,
-            "CHF": 0.92,
-            "CNY": 6.45,
-            "INR": 83.2,
-            "SGD": 1.35,
-            "KRW": 1300.0,
-            "BRL": 5.2,
-            "MXN": 17.5,
-            "RUB": 90.0,
-            "ZAR": 15.8
-        }
+        # Shared fetch layer (pooled connections, retries, one event loop)
+        self.client = client or get_fetch_client()
+        
+        # Fallback rates (in case API is down and nothing was saved)
+        self.fallback_rates = dict(FALLBACK_RATES)
         
         self.currency_names = {
             "USD": "US Dollar",
@@ -46,20 +42,199 @@ class CurrencyAPI:
             "RUB": "Russian Ruble",
             "ZAR": "South African Rand"
         }
+        
+        # Cached USD-based rate table (refetched at most once per TTL window;
+        # a failed refetch is retried after retry_after seconds)
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self._rates = None
+        self._cross_rates = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+        
+        # Where the cached table came from: "live", "saved" or "fallback"
+        self.rates_source = None
+        self.rates_timestamp = None
+        
+        # Local snapshot store for warm starts (pass store=False to disable)
+        if store is None:
+            try:
+                store = RateSnapshotStore()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Rate snapshot store unavailable: {e}")
+                store = False
+        self.store = store or None
+        
+        # Daily rate history fed by every live refresh (pass history=False to disable)
+        if history is None:
+            try:
+                history = RateHistoryStore()
+            except OSError as e:
+                print(f"Rate history store unavailable: {e}")
+                history = False
+        self.history = history if history is not False else None
     
-    def get_exchange_rates(self, base_currency="USD"):
-        """Get live exchange rates"""
+    async def _fetch_rates(self, base_currency="USD"):
+        """Fetch a rate table from the API (network call), or None on failure"""
         try:
-            response = requests.get(f"{self.base_url}{base_currency}", timeout=10)
+            response = await self.client.get(f"{self.base_url}{base_currency}")
             if response.status_code == 200:
                 data = response.json()
-                return data.get('rates', self.fallback_rates)
+                return data.get('rates')
             else:
                 print(f"API Error: {response.status_code}")
-                return self.fallback_rates
+                return None
         except Exception as e:
             print(f"Error fetching exchange rates: {e}")
-            return self.fallback_rates
+            return None
+    
+    def _latest_snapshot(self):
+        """Get (rates, timestamp) for the newest saved snapshot, or None"""
+        if not self.store:
+            return None
+        try:
+            return self.store.latest("USD")
+        except sqlite3.Error as e:
+            print(f"Error reading saved exchange rates: {e}")
+            return None
+    
+    def _resolve_rates(self, rates):
+        """Save freshly fetched rates, or fall back to the saved or built-in table"""
+        if rates:
+            timestamp = time.time()
+            if self.store:
+                try:
+                    self.store.save(rates, "USD", timestamp)
+                    self.store.prune()
+                except sqlite3.Error as e:
+                    print(f"Error saving exchange rates: {e}")
+            if self.history is not None:
+                try:
+                    self.history.record(rates)
+                except OSError as e:
+                    print(f"Error recording rate history: {e}")
+            return rates, "live", timestamp
+        
+        saved = self._latest_snapshot()
+        if saved:
+            return saved[0], "saved", saved[1]
+        return self.fallback_rates, "fallback", None
+    
+    def _store_rates(self, rates, source="live", timestamp=None, checked_at=None):
+        """Replace the cached rate table and its cross-rate matrix"""
+        cross_rates = CrossRateMatrix(rates)
+        with self._lock:
+            self._rates = rates
+            self._cross_rates = cross_rates
+            self._fetched_at = time.monotonic() if checked_at is None else checked_at
+            self.rates_source = source
+            self.rates_timestamp = timestamp
+        return cross_rates
+    
+    def _retry_checked_at(self):
+        """Check time that makes the cache go stale again after retry_after seconds"""
+        return time.monotonic() - self.ttl + self.retry_after
+    
+    def _apply_fetched(self, rates):
+        """Cache the result of a fetch and return the USD-based table now in use"""
+        if not rates and self._rates is not None:
+            # Keep the cached table and its age; only hold off the next retry
+            with self._lock:
+                self._fetched_at = max(self._fetched_at, self._retry_checked_at())
+            return self._rates
+        
+        rates, source, timestamp = self._resolve_rates(rates)
+        self._store_rates(rates, source, timestamp, None if source == "live" else self._retry_checked_at())
+        return rates
+    
+    def _revalidate(self, on_refresh=None):
+        """Refresh the cached table in the background (stale-while-revalidate)"""
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        
+        def finish(rates):
+            with self._lock:
+                self._refreshing = False
+            if on_refresh and rates is not None:
+                on_refresh(rates)
+        
+        def on_fetched(rates):
+            try:
+                rates = self._apply_fetched(rates)
+            except Exception as e:
+                print(f"Error applying exchange rates: {e}")
+                rates = None
+            finish(rates)
+        
+        self.client.submit(
+            self._fetch_rates("USD"),
+            on_success=on_fetched,
+            on_error=lambda e: finish(None)
+        )
+    
+    def is_refreshing(self):
+        """Check whether a background refresh is in progress"""
+        return self._refreshing
+    
+    def is_stale(self):
+        """Check whether the cached table is older than the TTL"""
+        return self._rates is None or time.monotonic() - self._fetched_at >= self.ttl
+    
+    def invalidate(self):
+        """Drop the cached table so the next lookup fetches fresh rates"""
+        with self._lock:
+            self._rates = None
+            self._cross_rates = None
+            self._fetched_at = 0.0
+    
+    def refresh(self):
+        """Fetch fresh rates now and return the new USD-based table"""
+        return self._apply_fetched(self.client.run(self._fetch_rates("USD")))
+    
+    def warm_start(self, on_refresh=None, force=False):
+        """Serve the newest saved (or built-in) rates now and refresh in the background
+        
+        Never blocks on the network. on_refresh(rates) is called from the
+        fetch loop thread once fresh rates have been fetched. With force the
+        background fetch starts even if the cached table is still fresh
+        (the table and its source stay in use until the new rates arrive).
+        """
+        if self._rates is None:
+            saved = self._latest_snapshot()
+            if saved:
+                rates, timestamp = saved
+                age = max(time.time() - timestamp, 0.0)
+                self._store_rates(rates, "saved", timestamp, time.monotonic() - age)
+            else:
+                self._store_rates(self.fallback_rates, "fallback", None, float("-inf"))
+        
+        if force or self.is_stale():
+            self._revalidate(on_refresh)
+        return self._rates
+    
+    def get_cross_rates(self):
+        """Get the cross-rate matrix for the cached snapshot, fetching only when needed"""
+        cross_rates = self._cross_rates
+        if cross_rates is None:
+            # Nothing cached yet - this is the only blocking fetch
+            self.refresh()
+            cross_rates = self._cross_rates
+        elif self.is_stale():
+            # Serve the stale table and refresh it in the background
+            self._revalidate()
+        return cross_rates
+    
+    def get_exchange_rates(self, base_currency="USD"):
+        """Get exchange rates from the cache, fetching only when needed"""
+        cross_rates = self.get_cross_rates()
+        if base_currency == "USD" or base_currency not in cross_rates:
+            return self._rates
+        
+        # Read the base currency's row instead of fetching another table
+        return dict(zip(cross_rates.codes, cross_rates.row(base_currency).tolist()))
     
     def convert_currency(self, amount, from_currency, to_currency):
         """Convert amount from one currency to another"""
@@ -67,27 +242,42 @@ class CurrencyAPI:
             if from_currency == to_currency:
                 return amount
             
-            # Get rates based on USD
-            usd_rates = self.get_exchange_rates("USD")
-            
-            # Convert to USD first, then to target currency
-            if from_currency == "USD":
-                usd_amount = amount
-            else:
-                usd_amount = amount / usd_rates.get(from_currency, 1)
-            
-            # Convert from USD to target currency
-            if to_currency == "USD":
-                converted_amount = usd_amount
-            else:
-                converted_amount = usd_amount * usd_rates.get(to_currency, 1)
-            
-            return converted_amount
+            # Single lookup in the precomputed cross-rate matrix
+            return amount * self.get_cross_rates().rate(from_currency, to_currency)
         
         except Exception as e:
             print(f"Error converting currency: {e}")
             return 0
     
+    def convert_many(self, amounts, from_codes, to_codes):
+        """Convert many amounts at once (arrays or sequences, scalars broadcast)
+        
+        Gathers from the same cross-rate matrix as convert_currency, so each
+        element matches the scalar result exactly - including 0 for a pair
+        with an unknown currency code.
+        """
+        amounts, from_codes, to_codes = np.broadcast_arrays(
+            np.asarray(amounts, dtype=float),
+            np.asarray(from_codes, dtype=str),
+            np.asarray(to_codes, dtype=str)
+        )
+        
+        # One matrix snapshot for the whole batch
+        cross_rates = self.get_cross_rates()
+        from_index = cross_rates.indices(from_codes, missing=-1)
+        to_index = cross_rates.indices(to_codes, missing=-1)
+        known = (from_index >= 0) & (to_index >= 0)
+        if not known.all():
+            # A code converts to itself even when unknown, as in convert_currency
+            known |= from_codes == to_codes
+            unknown = np.concatenate([from_codes[~known], to_codes[~known]])
+            unknown = [code for code in np.unique(unknown).tolist() if code not in cross_rates]
+            print(f"Error converting currency: unknown {', '.join(unknown)}")
+        
+        # Unknown codes gather from the last row/column, then are masked out
+        rates = cross_rates.matrix[from_index, to_index]
+        return np.where(known, amounts * rates, 0.0)
+    
     def get_currency_info(self, currency_code):
         """Get currency name"""
         return self.currency_names.get(currency_code, currency_code)
@@ -95,9 +285,9 @@ class CurrencyAPI:
     def get_popular_rates(self):
         """Get rates for popular currencies"""
         try:
-            rates = self.get_exchange_rates("USD")
-            popular = ["EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
-            return {curr: rates.get(curr, 1) for curr in popular if curr in rates}
+            cross_rates = self.get_cross_rates()
+            popular = cross_rates.codes[:cross_rates.popular_count]
+            return dict(zip(popular, cross_rates.popular_row("USD").tolist()))
         except:
             return {curr: self.fallback_rates.get(curr, 1) for curr in ["EUR", "GBP", "JPY", "INR"]}
 
@@ -114,4 +304,29 @@ if __name__ == "__main__":
     rates = api.get_popular_rates()
     print("\nPopular rates (vs USD):")
     for curr, rate in rates.items():
-        print(f"1 USD = {rate:.4f} {curr}")
\ No newline at end of file
+        print(f"1 USD = {rate:.4f} {curr}")
+    
+    # Benchmark batch conversion
+    n = 1_000_000
+    codes = np.array(list(api.get_exchange_rates("USD").keys())[:20])
+    rng = np.random.default_rng(0)
+    amounts = rng.uniform(1, 10000, n)
+    from_codes = codes[rng.integers(0, len(codes), n)]
+    to_codes = codes[rng.integers(0, len(codes), n)]
+    
+    start = time.perf_counter()
+    converted = api.convert_many(amounts, from_codes, to_codes)
+    elapsed = time.perf_counter() - start
+    print(f"\nconvert_many: {n:,} conversions in {elapsed * 1000:.1f} ms")
+    
+    # Spot-check against the scalar path
+    for i in range(0, n, n // 1000):
+        expected = api.convert_currency(amounts[i], from_codes[i], to_codes[i])
+        assert converted[i] == expected, (i, converted[i], expected)
+    
+    # Unknown codes give 0 on both paths (the amount itself for a same-code pair)
+    pairs = [("USD", "INR"), ("XXX", "INR"), ("USD", "XXX"), ("XXX", "XXX")]
+    mixed = api.convert_many(100, *zip(*pairs))
+    for amount, (from_code, to_code) in zip(mixed, pairs):
+        assert amount == api.convert_currency(100, from_code, to_code), (from_code, to_code, amount)
+    print("Batch results match convert_currency")
\ No newline at end of file
@@ -5,10 +5,13 @@ Description: Real-time currency converter with live exchange rates
 """
 
 import customtkinter as ctk
-import threading
+from datetime import datetime
 
-# Import colors from main config
-from config import COLORS
+# Import colors and shared fallback rates from main config
+from config import COLORS, FALLBACK_RATES
+
+# Headless cross-rate math
+from finsight.core.fx import convert, cross_rate
 
 # Import currency API
 try:
@@ -52,21 +55,7 @@ class CurrencyConverter(ctk.CTkFrame):
         }
         
         # Fallback exchange rates (used if API fails)
-        self.fallback_rates = {
-            "USD": 1.0,
-            "EUR": 0.85,
-            "GBP": 0.73,
-            "JPY": 110.0,
-            "CAD": 1.25,
-            "AUD": 1.35,
-            "CHF": 0.92,
-            "CNY": 6.45,
-            "INR": 83.2,
-            "SGD": 1.35,
-            "KRW": 1300.0,
-            "BRL": 5.2,
-            "MXN": 17.5
-        }
+        self.fallback_rates = dict(FALLBACK_RATES)
         
         self.current_rates = {}
         self.setup_ui()
@@ -233,11 +222,8 @@ class CurrencyConverter(ctk.CTkFrame):
         )
         self.results_frame.grid(row=0, column=1, padx=(10, 0), sticky="nsew")
         
-        # Initial placeholder
+        # Initial placeholder (replaced by the first conversion once rates are loaded)
         self.show_initial_placeholder()
-        
-        # Initial conversion
-        self.convert_currency()
     
     def show_initial_placeholder(self):
         """Show initial placeholder in results area"""
@@ -271,34 +257,54 @@ class CurrencyConverter(ctk.CTkFrame):
             text_color=COLORS['text_secondary']
         ).pack(pady=(0, 80))
     
-    def load_exchange_rates(self):
-        """Load exchange rates in background"""
-        def fetch_rates():
-            try:
-                if self.currency_api:
-                    self.current_rates = self.currency_api.get_exchange_rates("USD")
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text="✅ Live exchange rates loaded",
-                        text_color=COLORS['success']
-                    ))
-                else:
-                    self.current_rates = self.fallback_rates
-                    self.root.after(0, lambda: self.status_label.configure(
-                        text="⚠️ Using fallback rates (API unavailable)",
-                        text_color=COLORS['warning']
-                    ))
-                
-                # Auto-convert if amount is entered
-                self.root.after(0, self.convert_currency)
-                
-            except Exception as e:
-                self.current_rates = self.fallback_rates
-                self.root.after(0, lambda: self.status_label.configure(
-                    text="❌ Failed to load rates, using fallback",
-                    text_color="#dc2626"
-                ))
-        
-        threading.Thread(target=fetch_rates, daemon=True).start()
+    def load_exchange_rates(self, force=False):
+        """Show saved rates immediately and refresh them in the background
+        
+        With force the rates are refetched even if the cached ones are fresh.
+        """
+        if self.currency_api:
+            self.current_rates = self.currency_api.warm_start(
+                on_refresh=lambda rates: self.root.after(0, self.on_rates_refreshed),
+                force=force
+            )
+        else:
+            self.current_rates = self.fallback_rates
+        
+        self.update_rates_status()
+        self.convert_currency()
+    
+    def on_rates_refreshed(self):
+        """Pick up freshly fetched rates (runs on the Tk thread)"""
+        self.current_rates = self.currency_api.get_exchange_rates("USD")
+        self.update_rates_status()
+        self.convert_currency()
+    
+    def update_rates_status(self):
+        """Show where the current rates came from"""
+        source = self.currency_api.rates_source if self.currency_api else "fallback"
+        refreshing = self.currency_api is not None and self.currency_api.is_refreshing()
+        
+        if source == "live":
+            text = "✅ Live exchange rates loaded"
+            if refreshing:
+                text += " • refreshing..."
+            self.status_label.configure(text=text, text_color=COLORS['success'])
+        elif source == "saved":
+            saved_at = datetime.fromtimestamp(self.currency_api.rates_timestamp)
+            text = f"🕒 Saved rates from {saved_at.strftime('%b %d, %I:%M %p')}"
+            if refreshing:
+                text += " • refreshing..."
+            self.status_label.configure(text=text, text_color=COLORS['text_secondary'])
+        elif refreshing:
+            self.status_label.configure(
+                text="🔄 Loading exchange rates...",
+                text_color=COLORS['text_secondary']
+            )
+        else:
+            self.status_label.configure(
+                text="⚠️ Using fallback rates (API unavailable)",
+                text_color=COLORS['warning']
+            )
     
     def on_amount_change(self, event=None):
         """Auto-convert when amount changes"""
@@ -340,8 +346,7 @@ class CurrencyConverter(ctk.CTkFrame):
                 converted_amount = self.currency_api.convert_currency(amount, from_curr, to_curr)
             else:
                 # Fallback conversion via USD
-                usd_amount = amount / self.current_rates.get(from_curr, 1)
-                converted_amount = usd_amount * self.current_rates.get(to_curr, 1)
+                converted_amount = convert(amount, from_curr, to_curr, self.current_rates)
             
             # Clear results
             for widget in self.results_frame.winfo_children():
@@ -423,7 +428,10 @@ class CurrencyConverter(ctk.CTkFrame):
             
             # Exchange rate info
             if from_curr != to_curr:
-                rate = self.current_rates.get(to_curr, 1) / self.current_rates.get(from_curr, 1)
+                if self.currency_api and CURRENCY_API_AVAILABLE:
+                    rate = self.currency_api.get_cross_rates().rate(from_curr, to_curr)
+                else:
+                    rate = cross_rate(self.current_rates, from_curr, to_curr)
                 
                 rate_info_frame = ctk.CTkFrame(
                     result_card, 
@@ -444,7 +452,7 @@ class CurrencyConverter(ctk.CTkFrame):
             # Add popular rates at bottom
             self.show_compact_popular_rates(result_card)
             
-        except (ValueError, ZeroDivisionError):
+        except (ValueError, ZeroDivisionError, KeyError):
             # Show error for invalid input
             for widget in self.results_frame.winfo_children():
                 widget.destroy()
@@ -502,8 +510,5 @@ class CurrencyConverter(ctk.CTkFrame):
     
     def refresh_rates(self):
         """Refresh exchange rates"""
-        self.status_label.configure(
-            text="🔄 Refreshing exchange rates...",
-            text_color=COLORS['text_secondary']
-        )
-        self.load_exchange_rates()
+        # Keep showing the current rates while a fetch always goes out
+        self.load_exchange_rates(force=True)
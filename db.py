@@ -0,0 +1,23 @@
+"""
+Database Module
+Description: Short-lived SQLite connections shared by the local stores
+(rate snapshots, market data cache and news archive)
+"""
+
+import sqlite3
+from contextlib import contextmanager
+
+
+@contextmanager
+def connect(path, timeout=5):
+    """Open a connection for one unit of work: committed on success, rolled back on error, then closed
+
+    A short-lived connection per call keeps a store usable from any thread.
+    timeout is how long to wait, in seconds, for another writer's lock.
+    """
+    conn = sqlite3.connect(path, timeout=timeout)
+    try:
+        with conn:
+            yield conn
+    finally:
+        conn.close()
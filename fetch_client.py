@@ -0,0 +1,171 @@
+"""
+Fetch Client Module
+Description: Shared asyncio-based fetch layer for all outbound network calls,
+with pooled keep-alive sessions per host, a concurrency limit, per-host
+timeouts and retries with jittered backoff
+"""
+
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+
+from lazy_imports import lazy_import
+
+# requests is imported on the first fetch, not at startup
+requests = lazy_import("requests")
+
+# Per-host request timeouts in seconds (others use the client default)
+DEFAULT_HOST_TIMEOUTS = {
+    "api.exchangerate-api.com": 10,
+}
+
+# Status codes worth retrying
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    """Raised when a fetch returns an unusable response"""
+
+
+class FetchClient:
+    """Runs every fetch on one background asyncio event loop
+
+    HTTP calls go through one pooled requests.Session per host and run on a
+    small I/O executor, bounded by a semaphore. Blocking library calls
+    (e.g. yfinance) run on a separate executor via run_blocking, so they
+    can never starve the HTTP pool. Results are handed back to Tk with
+    root.after.
+    """
+
+    def __init__(self, max_concurrency=8, timeout=10, host_timeouts=None, retries=2, backoff=0.5):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.host_timeouts = dict(DEFAULT_HOST_TIMEOUTS if host_timeouts is None else host_timeouts)
+        self.retries = retries
+        self.backoff = backoff
+
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        self._io_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="fetch-io")
+        self._blocking_executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="fetch-blocking")
+
+        # Event loop on its own daemon thread
+        self.loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._thread = threading.Thread(target=self._run_loop, daemon=True, name="fetch-loop")
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _session(self, host):
+        """Get the keep-alive session for a host"""
+        with self._sessions_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def _backoff_delay(self, attempt):
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    async def get(self, url, params=None, headers=None, timeout=None, retries=None):
+        """GET a URL and return the requests.Response
+
+        Connection errors, timeouts and retryable status codes are retried
+        with jittered backoff; the last error (or response) is returned or
+        raised once retries run out.
+        """
+        host = urlparse(url).netloc
+        session = self._session(host)
+        timeout = timeout or self.host_timeouts.get(host, self.timeout)
+        retries = self.retries if retries is None else retries
+        request = partial(session.get, url, params=params, headers=headers, timeout=timeout)
+
+        for attempt in range(retries + 1):
+            try:
+                async with self._semaphore:
+                    response = await self.loop.run_in_executor(self._io_executor, request)
+                if response.status_code not in RETRY_STATUS_CODES or attempt == retries:
+                    return response
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == retries:
+                    raise
+            await asyncio.sleep(self._backoff_delay(attempt))
+
+    async def get_json(self, url, **kwargs):
+        """GET a URL and decode its JSON body (FetchError on a non-200 status)"""
+        response = await self.get(url, **kwargs)
+        if response.status_code != 200:
+            raise FetchError(f"API returned status code: {response.status_code}")
+        return response.json()
+
+    async def run_blocking(self, func, *args):
+        """Run a blocking call off the event loop"""
+        return await self.loop.run_in_executor(self._blocking_executor, partial(func, *args))
+
+    def submit(self, coro, on_success=None, on_error=None, root=None):
+        """Schedule a coroutine on the fetch loop and return its future
+
+        on_success(result) / on_error(exception) are called on the Tk thread
+        via root.after when root is given, otherwise on the loop thread.
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+        def deliver(done):
+            if done.cancelled():
+                return
+            try:
+                result = done.result()
+            except Exception as e:
+                callback, value = on_error, e
+                if on_error is None:
+                    print(f"Background fetch failed: {e}")
+            else:
+                callback, value = on_success, result
+            if callback is None:
+                return
+            if root is not None:
+                try:
+                    root.after(0, callback, value)
+                except RuntimeError:
+                    # Tk is shutting down
+                    pass
+            else:
+                callback(value)
+
+        future.add_done_callback(deliver)
+        return future
+
+    def submit_blocking(self, func, *args, on_success=None, on_error=None, root=None):
+        """Run a blocking call on the fetch layer (see submit for callbacks)"""
+        return self.submit(self.run_blocking(func, *args), on_success, on_error, root)
+
+    def run(self, coro, timeout=None):
+        """Run a coroutine on the fetch loop and wait for its result
+
+        For synchronous callers only; never call this from the loop thread.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def get_fetch_client():
+    """Get the process-wide FetchClient, creating it on first use"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = FetchClient()
+        return _shared_client
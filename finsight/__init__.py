@@ -0,0 +1,3 @@
+"""
+Finsight - Financial Intelligence Hub
+"""
@@ -0,0 +1,15 @@
+"""
+Finsight Core
+Description: Headless finance computations shared by the GUI, scripts,
+tests and worker processes - no Tk dependency
+"""
+
+from finsight.core.cashflow import build_cashflows, plan_yearly_growth, simulate_cashflows, simulate_plan
+from finsight.core.fx import POPULAR_CURRENCIES, CrossRateMatrix, convert, cross_rate
+from finsight.core.goals import bracketed_root, inflation_adjusted, required_monthly, required_rate, required_years
+from finsight.core.montecarlo import bootstrap_returns, lognormal_returns, monte_carlo_sip, sip_paths
+from finsight.core.quotes import daily_change, daily_changes, percent_change
+from finsight.core.returns import cagr, pad_portfolios, xirr, xnpv, year_fractions
+from finsight.core.sip import (
+    ScenarioGrid, future_value, schedule_months, sip_schedule, sip_summary, total_invested, yearly_growth
+)
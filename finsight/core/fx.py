@@ -0,0 +1,88 @@
+"""
+FX Core
+Description: Cross-rate arithmetic on USD-based rate tables (no Tk or
+network dependency)
+"""
+
+import numpy as np
+
+# Currencies shown in the popular-rates panels (kept first in the matrix index)
+POPULAR_CURRENCIES = ["EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY", "INR"]
+
+
+class CrossRateMatrix:
+    """Dense cross-rate table built once from a USD-based rate snapshot
+
+    matrix[i, j] is the amount of currency j bought by 1 unit of currency i.
+    Popular currencies occupy the first columns, so the popular-rates panel
+    is a plain slice (a view) of a row.
+    """
+
+    def __init__(self, usd_rates):
+        popular = [curr for curr in POPULAR_CURRENCIES if curr in usd_rates]
+        others = sorted(curr for curr in usd_rates if curr not in popular)
+        self.codes = popular + others
+        self.index = {curr: i for i, curr in enumerate(self.codes)}
+        self.popular_count = len(popular)
+
+        values = np.array([usd_rates[curr] for curr in self.codes], dtype=np.float64)
+        self.matrix = values[np.newaxis, :] / values[:, np.newaxis]
+        self.matrix.flags.writeable = False
+
+    def __contains__(self, currency_code):
+        return currency_code in self.index
+
+    def index_of(self, currency_code):
+        """Get the matrix index of a currency code"""
+        try:
+            return self.index[currency_code]
+        except KeyError:
+            raise KeyError(f"Unknown currency: {currency_code}") from None
+
+    def indices(self, codes, missing=None):
+        """Map an array of currency codes to matrix indices
+
+        Unknown codes raise KeyError, or map to missing when it is given.
+        """
+        codes = np.asarray(codes, dtype=str)
+        unique_codes, inverse = np.unique(codes, return_inverse=True)
+        if missing is None:
+            lookup = [self.index_of(code) for code in unique_codes.tolist()]
+        else:
+            lookup = [self.index.get(code, missing) for code in unique_codes.tolist()]
+        lookup = np.array(lookup, dtype=np.intp)
+        return lookup[inverse.reshape(codes.shape)]
+
+    def rate(self, from_currency, to_currency):
+        """Get the rate for 1 unit of from_currency in to_currency"""
+        return float(self.matrix[self.index_of(from_currency), self.index_of(to_currency)])
+
+    def row(self, currency_code):
+        """Get 1 unit of a currency in every currency (a view, in self.codes order)"""
+        return self.matrix[self.index_of(currency_code)]
+
+    def popular_row(self, currency_code="USD"):
+        """Get 1 unit of a currency in each popular currency (a view)"""
+        return self.matrix[self.index_of(currency_code), :self.popular_count]
+
+    def popular_block(self):
+        """Get the popular x popular cross-rate block (a view)"""
+        return self.matrix[:self.popular_count, :self.popular_count]
+
+
+def cross_rate(usd_rates, from_currency, to_currency):
+    """Get the rate for 1 unit of from_currency in to_currency from a USD-based table
+
+    Raises KeyError for a currency missing from the table.
+    """
+    try:
+        return usd_rates[to_currency] / usd_rates[from_currency]
+    except KeyError as e:
+        raise KeyError(f"Unknown currency: {e.args[0]}") from None
+
+
+def convert(amount, from_currency, to_currency, usd_rates):
+    """Convert an amount between two currencies through a USD-based table"""
+    if from_currency == to_currency:
+        return amount
+    return amount * cross_rate(usd_rates, from_currency, to_currency)
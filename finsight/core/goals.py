@@ -0,0 +1,177 @@
+"""
+Goal-seek Core
+Description: Solves SIP plans backwards from a target corpus - the monthly
+amount, return rate or duration needed (no Tk dependency). Closed forms are
+used where the SIP formula can be inverted; everything else goes through a
+vectorized bracketed root-finder. All solvers broadcast over arrays of goals.
+"""
+
+import numpy as np
+
+from finsight.core.cashflow import build_cashflows, constant_returns, plan_months, simulate_cashflows, simulate_plan
+from finsight.core.sip import future_value
+
+
+def bracketed_root(func, low, high, tol=1e-9, max_iter=200):
+    """Find roots of func between low and high, elementwise
+
+    func maps an array of candidates to an array of residuals. Uses the
+    Illinois variant of false position (superlinear, but never leaves the
+    bracket). Entries where func does not change sign over [low, high]
+    are NaN.
+    """
+    low, high = np.asarray(low, dtype=float), np.asarray(high, dtype=float)
+    f_low, f_high = np.asarray(func(low), dtype=float), np.asarray(func(high), dtype=float)
+    low, high, f_low, f_high = (array.copy() for array in np.broadcast_arrays(low, high, f_low, f_high))
+
+    valid = np.sign(f_low) != np.sign(f_high)
+    root = np.where(f_low == 0, low, np.where(f_high == 0, high, np.nan))
+    active = valid & np.isnan(root)
+    side = np.zeros(low.shape, dtype=int)
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        guess = np.where(active, (low * f_high - high * f_low) / np.where(active, f_high - f_low, 1), low)
+        f_guess = np.asarray(func(guess), dtype=float)
+
+        # Move the bracket end with the same sign; halve the stale end's residual (Illinois)
+        same_as_low = np.sign(f_guess) == np.sign(f_low)
+        move_low = active & same_as_low
+        move_high = active & ~same_as_low
+        low, f_low = np.where(move_low, guess, low), np.where(move_low, f_guess, f_low)
+        high, f_high = np.where(move_high, guess, high), np.where(move_high, f_guess, f_high)
+        f_high = np.where(move_low & (side == 1), f_high / 2, f_high)
+        f_low = np.where(move_high & (side == -1), f_low / 2, f_low)
+        side = np.where(move_low, 1, np.where(move_high, -1, side))
+
+        done = active & ((np.abs(high - low) <= tol * np.maximum(1, np.abs(guess))) | (f_guess == 0))
+        root = np.where(done, guess, root)
+        active &= ~done
+
+    root = np.where(active, (low + high) / 2, root)
+    return root.item() if root.ndim == 0 else root
+
+
+def inflation_adjusted(target, duration_years, inflation=0):
+    """Target corpus in money of the plan's end (target is in today's money)"""
+    return target * (1 + np.asarray(inflation, dtype=float) / 100) ** np.asarray(duration_years, dtype=float)
+
+
+def _result(value):
+    value = np.asarray(value, dtype=float)
+    return value.item() if value.ndim == 0 else value
+
+
+def required_monthly(target, duration_years, annual_return, inflation=0, **plan):
+    """Monthly investment needed to reach target after duration_years
+
+    target is in today's money when inflation (% p.a.) is given. The SIP
+    value is linear in the monthly amount (lumpsum adds a constant), so
+    this is closed form - even with step-up and pauses. Only plans with
+    withdrawals (which can deplete the corpus) use the root-finder; with
+    plan options duration_years must be a single value.
+    """
+    goal = inflation_adjusted(np.asarray(target, dtype=float), duration_years, inflation)
+    if not plan:
+        return _result(goal / future_value(1.0, duration_years, annual_return))
+
+    if plan.get("withdrawal_start") is None:
+        lumpsum = plan.pop("lumpsum", 0)
+        per_rupee = simulate_plan(duration_years, annual_return, 1.0, **plan)[3][..., -1]
+        from_lumpsum = simulate_plan(duration_years, annual_return, 0.0, lumpsum=lumpsum)[3][..., -1]
+        monthly = (goal - from_lumpsum) / per_rupee
+        return _result(np.maximum(monthly, 0.0))
+
+    months = plan_months(duration_years)
+    returns = constant_returns(annual_return, months)
+
+    def residual(monthly):
+        contributions, withdrawals = build_cashflows(months, monthly, **plan)
+        return simulate_cashflows(contributions, withdrawals, returns)[2][..., -1] - goal
+
+    high = goal + plan.get("withdrawal", 0) * months
+    return bracketed_root(residual, np.zeros_like(goal), high)
+
+
+def required_rate(target, monthly_investment, duration_years, inflation=0, low=0.0, high=100.0, **plan):
+    """Annual return (% p.a.) needed to reach target; NaN when outside [low, high]"""
+    goal = inflation_adjusted(np.asarray(target, dtype=float), duration_years, inflation)
+    if not plan:
+        return bracketed_root(lambda rate: future_value(monthly_investment, duration_years, rate) - goal, low, high)
+
+    months = plan_months(duration_years)
+    contributions, withdrawals = build_cashflows(months, monthly_investment, **plan)
+
+    def residual(rate):
+        returns = constant_returns(rate, months)
+        return simulate_cashflows(contributions, withdrawals, returns)[2][..., -1] - goal
+
+    return bracketed_root(residual, np.full(np.shape(goal), low), np.full(np.shape(goal), high))
+
+
+def required_years(target, monthly_investment, annual_return, inflation=0, max_years=100, **plan):
+    """Years of investing needed to reach target; NaN when not reached within max_years
+
+    A flat SIP without inflation inverts in closed form:
+    months = log(1 + target * r / (P * (1 + r))) / log(1 + r). An
+    inflation-adjusted target moves with the duration, so that case uses
+    the root-finder. Plans with options are scanned month by month
+    (returns whole months).
+    """
+    target = np.asarray(target, dtype=float)
+    monthly_investment = np.asarray(monthly_investment, dtype=float)
+    annual_return = np.asarray(annual_return, dtype=float)
+
+    if plan:
+        months = plan_months(max_years)
+        month = np.arange(1, months + 1)
+        values = simulate_plan(max_years, annual_return, monthly_investment, **plan)[3]
+        goal = inflation_adjusted(target[..., np.newaxis], month / 12, inflation)
+        reached = values >= goal
+        first = reached.argmax(axis=-1)
+        return _result(np.where(reached.any(axis=-1), (first + 1) / 12, np.nan))
+
+    if not np.any(inflation):
+        monthly_return = annual_return / 100 / 12
+        with np.errstate(divide="ignore", invalid="ignore"):
+            growing = np.log1p(target * monthly_return / (monthly_investment * (1 + monthly_return))) / np.log1p(monthly_return)
+        months = np.where(monthly_return > 0, growing, target / monthly_investment)
+        years = months / 12
+        return _result(np.where(years <= max_years, years, np.nan))
+
+    def residual(years):
+        return future_value(monthly_investment, years, annual_return) - inflation_adjusted(target, years, inflation)
+
+    shape = np.broadcast(target, monthly_investment, annual_return).shape
+    return bracketed_root(residual, np.full(shape, 1 / 12), np.full(shape, float(max_years)))
+
+
+# Goal-seek benchmark
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(0)
+    goals = 100000
+    targets = rng.uniform(1e6, 1e8, goals)
+    years = rng.integers(5, 40, goals)
+    rates = rng.uniform(4, 18, goals)
+
+    for name, solve in (
+        ("required_monthly", lambda: required_monthly(targets, years, rates, inflation=6)),
+        ("required_rate", lambda: required_rate(targets, 20000, years)),
+        ("required_years", lambda: required_years(targets, 20000, rates)),
+        ("required_years (inflation)", lambda: required_years(targets, 20000, rates, inflation=6)),
+    ):
+        start = time.perf_counter()
+        solved = solve()
+        print(f"{name}: {goals:,} goals in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    # Round trips through the forward formula
+    monthly = required_monthly(1e7, 15, 12)
+    assert np.isclose(future_value(monthly, 15, 12), 1e7)
+    assert np.isclose(required_rate(1e7, monthly, 15), 12)
+    assert np.isclose(required_years(1e7, monthly, 12), 15)
+    stepped = required_monthly(1e7, 15, 12, step_up=10, lumpsum=100000)
+    assert np.isclose(simulate_plan(15, 12, stepped, step_up=10, lumpsum=100000)[3][-1], 1e7)
+    print(f"Rs 1 Cr in 15 years at 12%: Rs {monthly:,.0f}/month flat, Rs {stepped:,.0f}/month with 10% step-up")
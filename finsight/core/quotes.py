@@ -0,0 +1,32 @@
+"""
+Quotes Core
+Description: Price-change math for market quotes (no Tk or network dependency)
+"""
+
+import numpy as np
+
+
+def percent_change(current, previous):
+    """Percent change from previous to current (scalars or NumPy arrays)"""
+    return (current - previous) / previous * 100
+
+
+def daily_change(closes):
+    """Get (last close, percent change vs the close before), or None with fewer than two closes"""
+    if len(closes) < 2:
+        return None
+    current, previous = float(closes[-1]), float(closes[-2])
+    return current, percent_change(current, previous)
+
+
+def daily_changes(closes):
+    """Vectorized daily_change for a (symbols x days) array of closes
+
+    Returns (last closes, percent changes) arrays; NaN where a row has
+    fewer than two closes.
+    """
+    closes = np.asarray(closes, dtype=float)
+    if closes.shape[-1] < 2:
+        nan = np.full(closes.shape[:-1], np.nan)
+        return nan, nan.copy()
+    return closes[..., -1], percent_change(closes[..., -1], closes[..., -2])
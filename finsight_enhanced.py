@@ -1,7 +1,6 @@
 import time
 import customtkinter as ctk
 import requests
-import threading
 import re
 from urllib.parse import urlparse
 from datetime import datetime
@@ -13,6 +12,12 @@ import pandas as pd
 import numpy as np
 import math
 
+# Shared fallback exchange rates
+from config import FALLBACK_RATES
+
+# Shared fetch layer
+from fetch_client import get_fetch_client, FetchError
+
 # Import our currency API
 try:
     from currency_api import CurrencyAPI
@@ -445,21 +450,7 @@ class CurrencyConverter(ctk.CTkFrame):
         }
         
         # Fallback exchange rates (used if API fails)
-        self.fallback_rates = {
-            "USD": 1.0,
-            "EUR": 0.85,
-            "GBP": 0.73,
-            "JPY": 110.0,
-            "CAD": 1.25,
-            "AUD": 1.35,
-            "CHF": 0.92,
-            "CNY": 6.45,
-            "INR": 83.2,
-            "SGD": 1.35,
-            "KRW": 1300.0,
-            "BRL": 5.2,
-            "MXN": 17.5
-        }
+        self.fallback_rates = dict(FALLBACK_RATES)
         
         self.current_rates = {}
         self.setup_ui()
@@ -691,7 +682,7 @@ class CurrencyConverter(ctk.CTkFrame):
                     text_color="#dc2626"
                 ))
         
-        threading.Thread(target=fetch_rates, daemon=True).start()
+        get_fetch_client().submit_blocking(fetch_rates)
     
     def on_amount_change(self, event=None):
         """Auto-convert when amount changes"""
@@ -991,6 +982,9 @@ class GUI:
         self.root = ctk.CTk()
         self.root.title("Finsight - Enhanced Financial Hub")
         
+        # Shared fetch layer for every network call
+        self.fetcher = get_fetch_client()
+        
         # Initialize news articles list for better refresh handling
         self.news_articles = []
 
@@ -1216,7 +1210,7 @@ class GUI:
             indices_grid.grid_columnconfigure(i, weight=1)
         
         # Load index data
-        threading.Thread(target=self.load_index_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_index_data)
 
     def load_index_data(self):
         """Load market indices data"""
@@ -1327,7 +1321,7 @@ class GUI:
             stocks_grid.grid_columnconfigure(i, weight=1)
         
         # Load stock data in background
-        threading.Thread(target=self.load_stock_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_stock_data)
         
         # Add refresh button for stock data
         refresh_stocks_btn = ctk.CTkButton(
@@ -1369,7 +1363,7 @@ class GUI:
         canvas_widget.pack(pady=10, padx=10, fill="both", expand=True)
         
         # Load chart data in background
-        threading.Thread(target=self.load_chart_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_chart_data)
 
     def load_stock_data(self):
         """Load real-time stock data"""
@@ -1528,33 +1522,34 @@ class GUI:
         )
         self.loading_label.pack(pady=15)
         
-        # Fetch news in background thread to prevent UI freezing
-        threading.Thread(target=self.fetch_and_display_news, daemon=True).start()
+        # Fetch news on the shared fetch loop to prevent UI freezing
+        self.fetcher.submit(
+            self.fetch_financial_news(),
+            on_success=self.display_financial_news,
+            on_error=self.on_news_error,
+            root=self.root
+        )
 
-    def fetch_and_display_news(self):
-        """Fetch financial/stock news from API and display in UI"""
-        try:
-            # Using MarketWatch RSS feed (verified working)
-            marketwatch_url = "https://api.rss2json.com/v1/api.json?rss_url=https://feeds.marketwatch.com/marketwatch/realtimeheadlines/"
-            
-            response = requests.get(marketwatch_url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 'ok':
-                    # Schedule UI update in main thread
-                    self.root.after(0, lambda: self.display_financial_news(data))
-                else:
-                    self.root.after(0, lambda: self.show_error("Failed to retrieve financial news data"))
-            else:
-                self.root.after(0, lambda: self.show_error(f"API returned status code: {response.status_code}"))
-                
-        except requests.exceptions.Timeout:
-            self.root.after(0, lambda: self.show_error("Request timed out. Please check your internet connection."))
-        except requests.exceptions.ConnectionError:
-            self.root.after(0, lambda: self.show_error("Connection error. Please check your internet connection."))
-        except Exception as e:
-            self.root.after(0, lambda: self.show_error(f"Error fetching financial news: {str(e)}"))
+    async def fetch_financial_news(self):
+        """Fetch financial/stock news from API"""
+        # Using MarketWatch RSS feed (verified working)
+        marketwatch_url = "https://api.rss2json.com/v1/api.json?rss_url=https://feeds.marketwatch.com/marketwatch/realtimeheadlines/"
+        
+        data = await self.fetcher.get_json(marketwatch_url)
+        if data.get('status') != 'ok':
+            raise FetchError("Failed to retrieve financial news data")
+        return data
+
+    def on_news_error(self, error):
+        """Show a news fetch failure (runs on the Tk thread)"""
+        if isinstance(error, requests.exceptions.Timeout):
+            self.show_error("Request timed out. Please check your internet connection.")
+        elif isinstance(error, requests.exceptions.ConnectionError):
+            self.show_error("Connection error. Please check your internet connection.")
+        elif isinstance(error, FetchError):
+            self.show_error(str(error))
+        else:
+            self.show_error(f"Error fetching financial news: {str(error)}")
 
     def display_financial_news(self, data):
         """Display financial news articles in the UI"""
@@ -1700,9 +1695,9 @@ class GUI:
                 widget_info['change_label'].configure(text="")
         
         # Reload data in background
-        threading.Thread(target=self.load_stock_data, daemon=True).start()
-        threading.Thread(target=self.load_index_data, daemon=True).start()
-        threading.Thread(target=self.load_chart_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_stock_data)
+        self.fetcher.submit_blocking(self.load_index_data)
+        self.fetcher.submit_blocking(self.load_chart_data)
 
     def show_error(self, error_message):
         """Display error message for financial news"""
@@ -5,25 +5,30 @@ Main Application File
 
 import time
 import customtkinter as ctk
-import requests
-import threading
-import re
-from urllib.parse import urlparse
 from datetime import datetime
-import yfinance as yf
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
-import numpy as np
-import math
 
 # Import configuration
-from config import COLORS
+from config import COLORS, LIVE_FEED, LIVE_FRAME_MS, NEWS_LIMIT
 
 # Import custom modules
-from sip_calculator import SIPCalculator
-from currency_converter import CurrencyConverter
+from fetch_client import get_fetch_client, FetchError
+from lazy_imports import lazy_import
+from market_cache import MarketDataCache
+from news_feed import NewsAggregator, rank_articles
+from news_store import NewsStore, clean_html
+from price_stream import create_feed
+from quote_engine import QuoteEngine, QuoteTable
+from virtual_grid import VirtualGrid
+from watchlist import Watchlist
+
+# Heavy libraries and views are imported on first use so the shell shows quickly
+requests = lazy_import("requests")
+plt = lazy_import("matplotlib.pyplot")
+mdates = lazy_import("matplotlib.dates")
+np = lazy_import("numpy")
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg")
+sip_calculator = lazy_import("sip_calculator")
+currency_converter = lazy_import("currency_converter")
 
 ctk.set_appearance_mode("Light")  # Force light mode for purple theme
 ctk.set_default_color_theme("blue")
@@ -36,8 +41,31 @@ class GUI:
         self.root = ctk.CTk()
         self.root.title("Finsight - Enhanced Financial Hub")
         
-        # Initialize news articles list for better refresh handling
+        # Shared fetch layer for every network call
+        self.fetcher = get_fetch_client()
+        
+        # Local OHLCV cache behind the chart and the batched quote loader
+        self.market_cache = MarketDataCache()
+        self.quote_engine = QuoteEngine(cache=self.market_cache)
+        
+        # User watchlist and the quote table behind the stock grid
+        self.watchlist = Watchlist()
+        self.quote_table = QuoteTable()
+        
+        # Live price feed (off until switched on) and its UI drain timer
+        self.live_feed = None
+        self.live_drain_job = None
+        
+        # Seen-article store and multi-feed aggregator behind the news list;
+        # news_items holds the articles shown (newest first) and news_articles
+        # the news widgets (header, search, list, buttons, errors)
+        self.news_store = NewsStore(symbols=lambda: list(self.watchlist.symbols))
+        self.news_aggregator = NewsAggregator(self.news_store, client=self.fetcher)
+        self.news_items = []
         self.news_articles = []
+        self.news_search_id = 0
+        self.news_search_job = None
+        self.news_refresh_id = 0
 
         # centring the app
         self.centring_the_app()
@@ -49,8 +77,12 @@ class GUI:
         self.content_frame = ctk.CTkFrame(self.root)
         self.content_frame.pack(pady=(0, 10), padx=10, fill="both", expand=True)
 
-        # Show dashboard by default
-        self.show_dashboard()
+        # Views are built on first use and kept alive across tab switches
+        self.views = {}
+        self.current_view = None
+
+        # Show dashboard by default, once the shell has had a chance to paint
+        self.root.after(50, self.show_dashboard)
 
         self.root.mainloop()
     
@@ -100,57 +132,56 @@ class GUI:
         )
         self.currency_btn.pack(side="left", padx=5)
     
-    def clear_content(self):
-        """Clear current content"""
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def show_view(self, name, build_view):
+        """Swap the content area to a view, building it only on first use
+        
+        Views are kept alive and hidden with pack_forget, so switching tabs
+        keeps their data and makes no network calls.
+        """
+        if self.current_view == name:
+            return
+        
+        # Hide the current view
+        if self.current_view is not None:
+            self.views[self.current_view].pack_forget()
+        
+        # Build the view once
+        if name not in self.views:
+            self.views[name] = build_view()
+        
+        self.views[name].pack(fill="both", expand=True, padx=10, pady=10)
+        self.current_view = name
+        
+        # Update button states
+        self.dashboard_btn.configure(state="disabled" if name == "dashboard" else "normal")
+        self.sip_btn.configure(state="disabled" if name == "sip" else "normal")
+        self.currency_btn.configure(state="disabled" if name == "currency" else "normal")
     
     def show_dashboard(self):
         """Show main dashboard"""
-        self.clear_content()
-        
-        # Update button states
-        self.dashboard_btn.configure(state="disabled")
-        self.sip_btn.configure(state="normal")
-        self.currency_btn.configure(state="normal")
-        
+        self.show_view("dashboard", self.build_dashboard)
+    
+    def build_dashboard(self):
+        """Build the dashboard view (once)"""
         # Create scrollable main frame
         self.main_frame = ctk.CTkScrollableFrame(
             self.content_frame,
             orientation="vertical",
             corner_radius=15
         )
-        self.main_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
         self.greeting()
         self.create_stock_widgets()
         self.load_news()
+        return self.main_frame
     
     def show_sip_calculator(self):
         """Show SIP Calculator"""
-        self.clear_content()
-        
-        # Update button states
-        self.dashboard_btn.configure(state="normal")
-        self.sip_btn.configure(state="disabled")
-        self.currency_btn.configure(state="normal")
-        
-        # Create SIP calculator
-        sip_calculator = SIPCalculator(self.content_frame)
-        sip_calculator.pack(fill="both", expand=True, padx=10, pady=10)
+        self.show_view("sip", lambda: sip_calculator.SIPCalculator(self.content_frame))
     
     def show_currency_converter(self):
         """Show Currency Converter"""
-        self.clear_content()
-        
-        # Update button states
-        self.dashboard_btn.configure(state="normal")
-        self.sip_btn.configure(state="normal")
-        self.currency_btn.configure(state="disabled")
-        
-        # Create currency converter
-        currency_converter = CurrencyConverter(self.content_frame)
-        currency_converter.pack(fill="both", expand=True, padx=10, pady=10)
+        self.show_view("currency", lambda: currency_converter.CurrencyConverter(self.content_frame))
 
     def greeting(self):
         current_time = time.strftime("%H:%M")
@@ -261,31 +292,21 @@ class GUI:
             indices_grid.grid_columnconfigure(i, weight=1)
         
         # Load index data
-        threading.Thread(target=self.load_index_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_index_data)
 
-    def load_index_data(self):
-        """Load market indices data"""
+    def load_index_data(self, force=False):
+        """Load market indices data (cached bars, one batched download when stale)"""
         try:
-            for symbol in self.index_widgets.keys():
-                try:
-                    ticker = yf.Ticker(symbol)
-                    hist = ticker.history(period="2d")
-                    
-                    if not hist.empty and len(hist) >= 2:
-                        current_value = hist['Close'].iloc[-1]
-                        prev_value = hist['Close'].iloc[-2]
-                        change = current_value - prev_value
-                        change_percent = (change / prev_value) * 100
-                        
-                        self.root.after(0, lambda s=symbol, v=current_value, c=change_percent:
-                                       self.update_index_widget(s, v, c))
-                        
-                except Exception as e:
-                    print(f"Error loading index {symbol}: {e}")
-                    
+            quotes = self.quote_engine.fetch_quotes(self.index_widgets.keys(), use_info_fallback=False, force=force)
+            self.root.after(0, self.update_index_widgets, quotes)
         except Exception as e:
             print(f"Error in load_index_data: {e}")
 
+    def update_index_widgets(self, quotes):
+        """Apply a batch of index quotes in one pass"""
+        for symbol, (value, change_percent) in quotes.items():
+            self.update_index_widget(symbol, value, change_percent)
+
     def update_index_widget(self, symbol, value, change_percent):
         """Update market index widget"""
         if symbol in self.index_widgets:
@@ -306,84 +327,216 @@ class GUI:
                 )
 
     def create_stock_price_widgets(self, parent):
-        """Create live stock price widgets"""
+        """Create the watchlist stock grid (virtualized - only visible rows get widgets)"""
         # Stock widgets container
         stock_container = ctk.CTkFrame(parent, corner_radius=10)
         stock_container.pack(pady=10, padx=15, fill="x")
         
-        stock_title = ctk.CTkLabel(
+        self.stock_title = ctk.CTkLabel(
             stock_container,
-            text="💰 Popular Stocks",
+            text=f"💰 Watchlist ({len(self.watchlist)})",
             font=("Arial", 16, "bold")
         )
-        stock_title.pack(pady=(10, 5))
+        self.stock_title.pack(pady=(10, 5))
         
-        # Create a frame for stock widgets grid
-        stocks_grid = ctk.CTkFrame(stock_container, fg_color="transparent")
-        stocks_grid.pack(pady=10, padx=10, fill="x")
+        # Add / remove symbols
+        edit_frame = ctk.CTkFrame(stock_container, fg_color="transparent")
+        edit_frame.pack(pady=(0, 5), padx=10)
         
-        # Popular stocks to display
-        popular_stocks = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN", "NVDA"]
+        self.symbol_entry = ctk.CTkEntry(
+            edit_frame,
+            placeholder_text="Symbols, e.g. META, NFLX",
+            width=220,
+            height=32
+        )
+        self.symbol_entry.pack(side="left", padx=5)
+        self.symbol_entry.bind("<Return>", lambda event: self.add_watchlist_symbols())
         
-        # Create stock widgets in a grid (3 columns, 2 rows)
-        self.stock_widgets = {}
-        for i, symbol in enumerate(popular_stocks):
-            row = i // 3
-            col = i % 3
-            
-            # Create individual stock widget
-            stock_widget = ctk.CTkFrame(stocks_grid, corner_radius=8, width=220, height=80)
-            stock_widget.grid(row=row, column=col, padx=8, pady=5, sticky="ew")
-            stock_widget.grid_propagate(False)
-            
-            # Stock symbol
-            symbol_label = ctk.CTkLabel(
-                stock_widget,
-                text=symbol,
-                font=("Arial", 14, "bold"),
-                text_color=("#1f538d", "#4a9eff")
-            )
-            symbol_label.pack(pady=(8, 2))
-            
-            # Price label (will be updated with real data)
-            price_label = ctk.CTkLabel(
-                stock_widget,
-                text="Loading...",
-                font=("Arial", 12)
-            )
-            price_label.pack()
-            
-            # Change label (will show percentage change)
-            change_label = ctk.CTkLabel(
-                stock_widget,
-                text="",
-                font=("Arial", 10)
-            )
-            change_label.pack(pady=(0, 8))
-            
-            self.stock_widgets[symbol] = {
-                'price_label': price_label,
-                'change_label': change_label,
-                'widget': stock_widget
-            }
+        ctk.CTkButton(
+            edit_frame,
+            text="➕ Add",
+            command=self.add_watchlist_symbols,
+            font=("Arial", 12),
+            height=32,
+            width=80
+        ).pack(side="left", padx=5)
         
-        # Configure grid weights
-        for i in range(3):
-            stocks_grid.grid_columnconfigure(i, weight=1)
+        ctk.CTkButton(
+            edit_frame,
+            text="➖ Remove",
+            command=self.remove_watchlist_symbols,
+            font=("Arial", 12),
+            height=32,
+            width=90
+        ).pack(side="left", padx=5)
+        
+        # Virtualized grid of stock cards (3 columns)
+        self.stock_placeholder = "Loading..."
+        self.stock_grid = VirtualGrid(
+            stock_container,
+            create_cell=self.create_stock_cell,
+            bind_cell=self.bind_stock_cell,
+            row_height=90,
+            columns=3,
+            height=280
+        )
+        self.stock_grid.pack(pady=10, padx=10, fill="x")
+        self.stock_grid.set_items(self.watchlist.symbols)
         
         # Load stock data in background
-        threading.Thread(target=self.load_stock_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_stock_data)
+        
+        controls_frame = ctk.CTkFrame(stock_container, fg_color="transparent")
+        controls_frame.pack(pady=(10, 15))
         
         # Add refresh button for stock data
         refresh_stocks_btn = ctk.CTkButton(
-            stock_container,
+            controls_frame,
             text="🔄 Refresh Stock Prices",
             command=self.refresh_stock_data,
             font=("Arial", 12),
             height=32,
             width=200
         )
-        refresh_stocks_btn.pack(pady=(10, 15))
+        refresh_stocks_btn.pack(side="left", padx=10)
+        
+        # Live streaming toggle
+        self.live_switch = ctk.CTkSwitch(
+            controls_frame,
+            text="📡 Live prices",
+            command=self.toggle_live_prices,
+            font=("Arial", 12)
+        )
+        self.live_switch.pack(side="left", padx=10)
+
+    def create_stock_cell(self, parent):
+        """Create one reusable stock card for the virtual grid"""
+        stock_widget = ctk.CTkFrame(parent, corner_radius=8)
+        
+        # Stock symbol
+        stock_widget.symbol_label = ctk.CTkLabel(
+            stock_widget,
+            text="",
+            font=("Arial", 14, "bold"),
+            text_color=("#1f538d", "#4a9eff")
+        )
+        stock_widget.symbol_label.pack(pady=(8, 2))
+        
+        # Price label
+        stock_widget.price_label = ctk.CTkLabel(
+            stock_widget,
+            text="",
+            font=("Arial", 12)
+        )
+        stock_widget.price_label.pack()
+        
+        # Change label (shows percentage change)
+        stock_widget.change_label = ctk.CTkLabel(
+            stock_widget,
+            text="",
+            font=("Arial", 10)
+        )
+        stock_widget.change_label.pack(pady=(0, 8))
+        
+        return stock_widget
+
+    def bind_stock_cell(self, stock_widget, symbol):
+        """Show a symbol's quote in a recycled stock card"""
+        quote = self.quote_table.get(symbol)
+        
+        # Skip the configure calls when the card already shows this
+        shown = (symbol, quote, self.stock_placeholder)
+        if getattr(stock_widget, "shown", None) == shown:
+            return
+        stock_widget.shown = shown
+        
+        stock_widget.symbol_label.configure(text=symbol)
+        
+        if quote is None:
+            stock_widget.price_label.configure(text=self.stock_placeholder)
+            stock_widget.change_label.configure(text="")
+            return
+        
+        price, change_percent = quote
+        
+        # Update price
+        if isinstance(price, (int, float)):
+            stock_widget.price_label.configure(text=f"${price:.2f}")
+        else:
+            stock_widget.price_label.configure(text=str(price))
+        
+        # Update change
+        if isinstance(change_percent, (int, float)) and change_percent != 0:
+            change_text = f"{change_percent:+.2f}%"
+            color = ("#16a34a", "#22c55e") if change_percent > 0 else ("#dc2626", "#ef4444")
+            arrow = "▲" if change_percent > 0 else "▼"
+            stock_widget.change_label.configure(
+                text=f"{arrow} {change_text}",
+                text_color=color
+            )
+        else:
+            stock_widget.change_label.configure(
+                text="--",
+                text_color=ctk.ThemeManager.theme["CTkLabel"]["text_color"]
+            )
+
+    def toggle_live_prices(self):
+        """Start or stop streaming watchlist prices"""
+        if self.live_switch.get():
+            if self.live_feed is None:
+                self.live_feed = create_feed(
+                    LIVE_FEED,
+                    self.quote_table,
+                    lambda: list(self.watchlist.symbols),
+                    engine=self.quote_engine,
+                    client=self.fetcher
+                )
+            self.live_feed.start()
+            if self.live_drain_job is None:
+                self.drain_live_quotes()
+        else:
+            if self.live_feed is not None:
+                self.live_feed.stop()
+            if self.live_drain_job is not None:
+                self.root.after_cancel(self.live_drain_job)
+                self.live_drain_job = None
+
+    def drain_live_quotes(self):
+        """Apply every tick since the last frame in one pass, at a fixed frame rate"""
+        changes = self.quote_table.take_changes()
+        if changes:
+            self.stock_grid.refresh(changes)
+        self.live_drain_job = self.root.after(LIVE_FRAME_MS, self.drain_live_quotes)
+
+    def add_watchlist_symbols(self):
+        """Add the symbols typed in the entry to the watchlist"""
+        added = self.watchlist.add(self.symbol_entry.get())
+        self.symbol_entry.delete(0, "end")
+        if added:
+            self.on_watchlist_changed()
+            self.fetcher.submit_blocking(self.news_store.tag_symbols, added)
+            self.fetcher.submit(
+                self.fetcher.run_blocking(self.quote_engine.fetch_quotes, added),
+                on_success=self.update_stock_widgets,
+                root=self.root
+            )
+
+    def remove_watchlist_symbols(self):
+        """Remove the symbols typed in the entry from the watchlist"""
+        text = self.symbol_entry.get().replace(",", " ")
+        self.symbol_entry.delete(0, "end")
+        removed = [symbol for symbol in text.split() if self.watchlist.remove(symbol)]
+        for symbol in removed:
+            self.quote_table.remove(symbol.upper())
+        if removed:
+            self.on_watchlist_changed()
+
+    def on_watchlist_changed(self):
+        """Re-point the grid at the edited watchlist"""
+        self.stock_title.configure(text=f"💰 Watchlist ({len(self.watchlist)})")
+        self.stock_grid.set_items(self.watchlist.symbols)
+        if hasattr(self, 'news_symbol_filter'):
+            self.news_symbol_filter.configure(values=["All symbols"] + self.watchlist.symbols)
 
     def create_market_chart(self, parent):
         """Create market chart using matplotlib"""
@@ -407,78 +560,47 @@ class GUI:
         self.ax.set_title('Loading S&P 500 Data...', color='white' if ctk.get_appearance_mode() == "Dark" else 'black')
         self.ax.set_facecolor('#2b2b2b' if ctk.get_appearance_mode() == "Dark" else 'white')
         
+        # Price artists are created with the first real data
+        self.price_line = None
+        self.chart_background = None
+        self.chart_extent = None
+        
         # Embed chart in tkinter
-        self.canvas = FigureCanvasTkAgg(self.fig, chart_container)
+        self.canvas = backend_tkagg.FigureCanvasTkAgg(self.fig, chart_container)
+        self.canvas.mpl_connect('draw_event', self.on_chart_draw)
         self.canvas.draw()
         canvas_widget = self.canvas.get_tk_widget()
         canvas_widget.pack(pady=10, padx=10, fill="both", expand=True)
         
         # Load chart data in background
-        threading.Thread(target=self.load_chart_data, daemon=True).start()
+        self.fetcher.submit_blocking(self.load_chart_data)
 
-    def load_stock_data(self):
-        """Load real-time stock data"""
+    def load_stock_data(self, force=False):
+        """Load stock data for the watchlist (cached bars, one batched download when stale)"""
         try:
-            for symbol in self.stock_widgets.keys():
-                try:
-                    # Get stock info
-                    stock = yf.Ticker(symbol)
-                    info = stock.info
-                    hist = stock.history(period="2d")
-                    
-                    if not hist.empty and len(hist) >= 2:
-                        current_price = hist['Close'].iloc[-1]
-                        prev_price = hist['Close'].iloc[-2]
-                        change = current_price - prev_price
-                        change_percent = (change / prev_price) * 100
-                        
-                        # Update UI in main thread
-                        self.root.after(0, lambda s=symbol, p=current_price, c=change_percent: 
-                                       self.update_stock_widget(s, p, c))
-                    else:
-                        # Fallback to basic info
-                        current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
-                        if current_price:
-                            self.root.after(0, lambda s=symbol, p=current_price: 
-                                           self.update_stock_widget(s, p, 0))
-                        
-                except Exception as e:
-                    print(f"Error loading {symbol}: {e}")
-                    self.root.after(0, lambda s=symbol: self.update_stock_widget(s, "Error", 0))
-                    
+            quotes = self.quote_engine.fetch_quotes(list(self.watchlist.symbols), force=force)
+            self.root.after(0, self.update_stock_widgets, quotes)
         except Exception as e:
             print(f"Error in load_stock_data: {e}")
+            self.root.after(0, self.update_stock_widgets, {})
 
-    def update_stock_widget(self, symbol, price, change_percent):
-        """Update individual stock widget with real data"""
-        if symbol in self.stock_widgets:
-            widget_info = self.stock_widgets[symbol]
-            
-            # Update price
-            if isinstance(price, (int, float)):
-                price_text = f"${price:.2f}"
-                widget_info['price_label'].configure(text=price_text)
-            else:
-                widget_info['price_label'].configure(text=str(price))
-            
-            # Update change
-            if isinstance(change_percent, (int, float)) and change_percent != 0:
-                change_text = f"{change_percent:+.2f}%"
-                color = ("#16a34a", "#22c55e") if change_percent > 0 else ("#dc2626", "#ef4444")
-                arrow = "▲" if change_percent > 0 else "▼"
-                widget_info['change_label'].configure(
-                    text=f"{arrow} {change_text}",
-                    text_color=color
-                )
-            else:
-                widget_info['change_label'].configure(text="--")
+    def update_stock_widgets(self, quotes):
+        """Apply a batch of stock quotes and redraw the visible cards once"""
+        self.quote_table.update(quotes)
+        # The refresh is over; cards still without a quote go back to the initial text
+        self.stock_placeholder = "Loading..."
+        self.stock_grid.refresh()
 
-    def load_chart_data(self):
-        """Load S&P 500 chart data"""
+    def load_chart_data(self, force=False):
+        """Load S&P 500 chart data from the local cache, fetching only new bars"""
         try:
-            # Get S&P 500 data
-            sp500 = yf.Ticker("^GSPC")
-            hist = sp500.history(period="1mo")  # Last 30 days
+            # Bring the cache up to date (no network call if it is fresh)
+            try:
+                self.market_cache.update(["^GSPC"], force=force)
+            except Exception as e:
+                print(f"Error updating S&P 500 data: {e}")
+            
+            hist = self.market_cache.history("^GSPC", days=31)  # Last 30 days
             
             if not hist.empty:
                 # Schedule chart update in main thread
@@ -490,70 +612,119 @@ class GUI:
             self.root.after(0, lambda: self.show_chart_error(f"Error: {str(e)}"))
 
     def update_chart(self, data):
-        """Update the market chart with real data"""
+        """Update the market chart with real data
+
+        The line, fill and annotation artists are kept and only their data
+        changes. When the axis extent is unchanged they are blitted over a
+        cached background (a few ms); otherwise the axes are re-laid out
+        and fully redrawn once.
+        """
         try:
-            # Clear previous plot
-            self.ax.clear()
-            
-            # Set style based on appearance mode
-            is_dark = ctk.get_appearance_mode() == "Dark"
-            bg_color = '#2b2b2b' if is_dark else 'white'
-            text_color = 'white' if is_dark else 'black'
-            grid_color = '#404040' if is_dark else '#e0e0e0'
-            
-            self.ax.set_facecolor(bg_color)
+            if self.price_line is None:
+                self.build_chart_artists()
             
             # Plot the closing prices
-            dates = data.index
-            closes = data['Close']
-            
-            # Create the line plot
-            self.ax.plot(dates, closes, color='#4a9eff', linewidth=2.5, alpha=0.9)
-            
-            # Fill area under the curve
-            self.ax.fill_between(dates, closes, alpha=0.2, color='#4a9eff')
+            dates = mdates.date2num(data.index)
+            closes = data['Close'].to_numpy(dtype=float)
             
-            # Styling
-            self.ax.set_title('S&P 500 Index - Last 30 Days', 
-                            color=text_color, fontsize=14, fontweight='bold', pad=20)
-            self.ax.set_xlabel('Date', color=text_color, fontsize=12)
-            self.ax.set_ylabel('Price ($)', color=text_color, fontsize=12)
+            self.price_line.set_data(dates, closes)
             
-            # Grid
-            self.ax.grid(True, alpha=0.3, color=grid_color)
+            # Area under the curve: the line forward, then back along zero
+            self.price_fill.set_verts([np.column_stack([
+                np.concatenate([dates, dates[::-1]]),
+                np.concatenate([closes, np.zeros(len(closes))])
+            ])])
             
-            # Format axes
-            self.ax.tick_params(colors=text_color, labelsize=10)
+            # Current price annotation
+            current_price = closes[-1]
+            self.price_annotation.xy = (dates[-1], current_price)
+            self.price_annotation.set_text(f'${current_price:.2f}')
             
-            # Format dates on x-axis
-            self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
-            self.ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
+            x_margin = max((dates[-1] - dates[0]) * 0.05, 0.5)
+            extent = (dates[0] - x_margin, dates[-1] + x_margin, 0, closes.max() * 1.05)
             
-            # Rotate date labels
-            plt.setp(self.ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
-            
-            # Add current price annotation
-            current_price = closes.iloc[-1]
-            self.ax.annotate(f'${current_price:.2f}', 
-                           xy=(dates[-1], current_price),
-                           xytext=(10, 10), textcoords='offset points',
-                           bbox=dict(boxstyle='round,pad=0.3', facecolor='#4a9eff', alpha=0.8),
-                           color='white', fontweight='bold')
-            
-            # Tight layout
-            self.fig.tight_layout()
-            
-            # Redraw canvas
-            self.canvas.draw()
+            if extent != self.chart_extent:
+                # New extent: new ticks and labels, so lay out and redraw everything
+                self.chart_extent = extent
+                self.ax.set_xlim(extent[0], extent[1])
+                self.ax.set_ylim(extent[2], extent[3])
+                for label in self.ax.get_xticklabels():
+                    label.set_horizontalalignment('right')
+                self.fig.tight_layout()
+                self.canvas.draw()
+            else:
+                self.blit_chart()
             
         except Exception as e:
             print(f"Error updating chart: {e}")
             self.show_chart_error(f"Chart update error: {str(e)}")
 
+    def build_chart_artists(self):
+        """Style the axes and create the persistent price artists (animated for blitting)"""
+        self.ax.clear()
+        
+        # Set style based on appearance mode
+        is_dark = ctk.get_appearance_mode() == "Dark"
+        bg_color = '#2b2b2b' if is_dark else 'white'
+        text_color = 'white' if is_dark else 'black'
+        grid_color = '#404040' if is_dark else '#e0e0e0'
+        
+        self.ax.set_facecolor(bg_color)
+        
+        # Line, area and annotation get their data in update_chart
+        self.price_line, = self.ax.plot([], [], color='#4a9eff', linewidth=2.5, alpha=0.9, animated=True)
+        self.price_fill = self.ax.fill_between([0, 1], [0, 0], alpha=0.2, color='#4a9eff', animated=True)
+        self.price_annotation = self.ax.annotate('', 
+                                                xy=(0, 0),
+                                                xytext=(10, 10), textcoords='offset points',
+                                                bbox=dict(boxstyle='round,pad=0.3', facecolor='#4a9eff', alpha=0.8),
+                                                color='white', fontweight='bold', animated=True)
+        
+        # Styling
+        self.ax.set_title('S&P 500 Index - Last 30 Days', 
+                        color=text_color, fontsize=14, fontweight='bold', pad=20)
+        self.ax.set_xlabel('Date', color=text_color, fontsize=12)
+        self.ax.set_ylabel('Price ($)', color=text_color, fontsize=12)
+        
+        # Grid
+        self.ax.grid(True, alpha=0.3, color=grid_color)
+        
+        # Format axes
+        self.ax.tick_params(colors=text_color, labelsize=10)
+        self.ax.tick_params(axis='x', labelrotation=45)
+        
+        # Format dates on x-axis
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
+        self.ax.xaxis.set_major_locator(mdates.WeekdayLocator(interval=1))
+        
+        self.chart_extent = None
+
+    def on_chart_draw(self, event):
+        """After a full redraw, cache the static background and draw the price artists on it"""
+        if self.price_line is None:
+            return
+        self.chart_background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self.draw_chart_artists()
+
+    def draw_chart_artists(self):
+        for artist in (self.price_fill, self.price_line, self.price_annotation):
+            self.ax.draw_artist(artist)
+
+    def blit_chart(self):
+        """Redraw only the price artists over the cached background"""
+        if self.chart_background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.chart_background)
+        self.draw_chart_artists()
+        self.canvas.blit(self.fig.bbox)
+
     def show_chart_error(self, error_msg):
         """Show error message on chart"""
         try:
             self.ax.clear()
+            self.price_line = None
+            self.chart_background = None
             self.ax.text(0.5, 0.5, f"📊 Chart Error\n{error_msg}", 
                         transform=self.ax.transAxes, ha='center', va='center',
                         fontsize=12, color='red')
@@ -573,35 +744,40 @@ class GUI:
         )
         self.loading_label.pack(pady=15)
         
-        # Fetch news in background thread to prevent UI freezing
-        threading.Thread(target=self.fetch_and_display_news, daemon=True).start()
+        # Show the newest stored articles first; the feeds are fetched after
+        self.fetcher.submit_blocking(
+            self.news_store.recent, NEWS_LIMIT,
+            on_success=self.display_financial_news,
+            on_error=self.on_news_error,
+            root=self.root
+        )
 
-    def fetch_and_display_news(self):
-        """Fetch financial/stock news from API and display in UI"""
-        try:
-            # Using MarketWatch RSS feed (verified working)
-            marketwatch_url = "https://api.rss2json.com/v1/api.json?rss_url=https://feeds.marketwatch.com/marketwatch/realtimeheadlines/"
-            
-            response = requests.get(marketwatch_url, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('status') == 'ok':
-                    # Schedule UI update in main thread
-                    self.root.after(0, lambda: self.display_financial_news(data))
-                else:
-                    self.root.after(0, lambda: self.show_error("Failed to retrieve financial news data"))
-            else:
-                self.root.after(0, lambda: self.show_error(f"API returned status code: {response.status_code}"))
-                
-        except requests.exceptions.Timeout:
-            self.root.after(0, lambda: self.show_error("Request timed out. Please check your internet connection."))
-        except requests.exceptions.ConnectionError:
-            self.root.after(0, lambda: self.show_error("Connection error. Please check your internet connection."))
-        except Exception as e:
-            self.root.after(0, lambda: self.show_error(f"Error fetching financial news: {str(e)}"))
+    async def fetch_financial_news(self, refresh_id):
+        """Fetch every news feed concurrently; get (new articles, errors by feed)
 
-    def display_financial_news(self, data):
+        Each feed's new articles are merged into the list as soon as it lands.
+        """
+        def on_articles(articles):
+            try:
+                self.root.after(0, self.insert_new_articles, refresh_id, articles)
+            except RuntimeError:
+                # Tk is shutting down
+                pass
+
+        return await self.news_aggregator.fetch_all(on_articles)
+
+    def on_news_error(self, error):
+        """Show a news fetch failure (runs on the Tk thread)"""
+        if isinstance(error, requests.exceptions.Timeout):
+            self.show_error("Request timed out. Please check your internet connection.")
+        elif isinstance(error, requests.exceptions.ConnectionError):
+            self.show_error("Connection error. Please check your internet connection.")
+        elif isinstance(error, FetchError):
+            self.show_error(str(error))
+        else:
+            self.show_error(f"Error fetching financial news: {str(error)}")
+
+    def display_financial_news(self, articles):
         """Display financial news articles in the UI"""
         # Remove loading message
         if hasattr(self, 'loading_label'):
@@ -617,92 +793,23 @@ class GUI:
         news_header.pack(pady=(20, 10))
         self.news_articles.append(news_header)
         
-        # Display news articles
-        articles = data.get('items', [])[:8]  # Show top 8 financial articles
+        # Archive search (results appear under the search bar)
+        self.create_news_search()
         
-        for i, article in enumerate(articles):
-            # Create frame for each article with financial styling
-            article_frame = ctk.CTkFrame(
-                self.main_frame, 
-                corner_radius=12,
-                border_width=1,
-                border_color=("#d4d4d8", "#3f3f46")
-            )
-            article_frame.pack(pady=8, padx=15, fill="x")
-            self.news_articles.append(article_frame)
-            
-            # Article title
-            title = article.get('title', 'No title')
-            # Clean up title
-            if len(title) > 100:
-                title = title[:100] + "..."
-                
-            title_label = ctk.CTkLabel(
-                article_frame, 
-                text=title, 
-                font=("Arial", 15, "bold"),
-                wraplength=720,
-                justify="left",
-                text_color=("#1a1a1a", "#ffffff")
-            )
-            title_label.pack(pady=(15, 8), padx=15, anchor="w")
-            
-            # Article description/content
-            description = article.get('description', '') or article.get('content', '')
-            if not description:
-                description = "Click to read full article..."
-            
-            # Clean up description (remove HTML tags)
-            description = re.sub(r'<[^>]+>', '', description)
-            if len(description) > 200:
-                description = description[:200] + "..."
-                
-            desc_label = ctk.CTkLabel(
-                article_frame, 
-                text=description, 
-                font=("Arial", 13),
-                wraplength=720,
-                justify="left",
-                text_color=("#4a5568", "#a0aec0")
-            )
-            desc_label.pack(pady=(0, 8), padx=15, anchor="w")
-            
-            # Create a frame for metadata (date, source, link)
-            meta_frame = ctk.CTkFrame(article_frame, fg_color="transparent")
-            meta_frame.pack(fill="x", padx=15, pady=(0, 15))
-            
-            # Publication date
-            pub_date = article.get('pubDate', '')
-            if pub_date:
-                try:
-                    # Handle different date formats
-                    if 'T' in pub_date:
-                        date_obj = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
-                    else:
-                        date_obj = datetime.strptime(pub_date[:19], "%Y-%m-%d %H:%M:%S")
-                    
-                    formatted_date = date_obj.strftime("%b %d, %Y • %I:%M %p")
-                except:
-                    formatted_date = pub_date[:16] if len(pub_date) > 16 else pub_date
-                    
-                date_label = ctk.CTkLabel(
-                    meta_frame,
-                    text=f"🕒 {formatted_date}",
-                    font=("Arial", 11),
-                    text_color=("#718096", "#a0aec0")
-                )
-                date_label.pack(side="left", pady=2)
-            
-            # Source information
-            source = article.get('author', 'Financial News')
-            if source:
-                source_label = ctk.CTkLabel(
-                    meta_frame,
-                    text=f"📰 {source}",
-                    font=("Arial", 11),
-                    text_color=("#718096", "#a0aec0")
-                )
-                source_label.pack(side="right", pady=2)
+        # Display news articles (virtualized - only visible rows get widgets)
+        self.news_items = list(articles[:NEWS_LIMIT])
+        self.news_grid = VirtualGrid(
+            self.main_frame,
+            create_cell=self.create_news_cell,
+            bind_cell=self.bind_news_cell,
+            row_height=175,
+            columns=1,
+            height=540,
+            cell_padding=6
+        )
+        self.news_grid.pack(pady=8, padx=15, fill="x")
+        self.news_grid.set_items(self.news_items)
+        self.news_articles.append(self.news_grid)
 
         # Add refresh button
         self.news_refresh_button = ctk.CTkButton(
@@ -716,27 +823,247 @@ class GUI:
         self.news_refresh_button.pack(pady=20)
         self.news_articles.append(self.news_refresh_button)
 
-    def refresh_news(self):
-        """Refresh the financial news"""
-        # Remove existing news articles only
-        for article_widget in self.news_articles:
-            try:
-                article_widget.destroy()
-            except:
-                pass
+        # Then pull in whatever the feeds have that is new
+        self.refresh_news()
+
+    def create_news_cell(self, parent):
+        """Create one reusable article card for the virtual news list"""
+        # Card with financial styling
+        article_frame = ctk.CTkFrame(
+            parent, 
+            corner_radius=12,
+            border_width=1,
+            border_color=("#d4d4d8", "#3f3f46")
+        )
         
-        self.news_articles.clear()
+        # Article title
+        article_frame.title_label = ctk.CTkLabel(
+            article_frame, 
+            text="", 
+            font=("Arial", 15, "bold"),
+            wraplength=720,
+            justify="left",
+            text_color=("#1a1a1a", "#ffffff")
+        )
+        article_frame.title_label.pack(pady=(12, 6), padx=15, anchor="w")
         
-        # Reload news
-        self.load_news()
+        # Article description/content
+        article_frame.desc_label = ctk.CTkLabel(
+            article_frame, 
+            text="", 
+            font=("Arial", 13),
+            wraplength=720,
+            justify="left",
+            text_color=("#4a5568", "#a0aec0")
+        )
+        article_frame.desc_label.pack(pady=(0, 6), padx=15, anchor="w")
+        
+        # Metadata (date, source) pinned to the bottom of the card
+        meta_frame = ctk.CTkFrame(article_frame, fg_color="transparent")
+        meta_frame.pack(side="bottom", fill="x", padx=15, pady=(0, 10))
+        
+        article_frame.date_label = ctk.CTkLabel(
+            meta_frame,
+            text="",
+            font=("Arial", 11),
+            text_color=("#718096", "#a0aec0")
+        )
+        article_frame.date_label.pack(side="left", pady=2)
+        
+        article_frame.source_label = ctk.CTkLabel(
+            meta_frame,
+            text="",
+            font=("Arial", 11),
+            text_color=("#718096", "#a0aec0")
+        )
+        article_frame.source_label.pack(side="right", pady=2)
+        
+        return article_frame
+
+    def bind_news_cell(self, article_frame, article):
+        """Show an article in a recycled card"""
+        # Skip the configure calls when the card already shows this article
+        if getattr(article_frame, "shown", None) is article:
+            return
+        article_frame.shown = article
+        
+        # Clean up title
+        title = article.get('title', 'No title')
+        if len(title) > 100:
+            title = title[:100] + "..."
+        article_frame.title_label.configure(text=title)
+        
+        # Clean up description (remove HTML tags)
+        description = article.get('description', '') or article.get('content', '')
+        description = clean_html(description) or "Click to read full article..."
+        if len(description) > 200:
+            description = description[:200] + "..."
+        article_frame.desc_label.configure(text=description)
+        
+        pub_date = article.get('pubDate', '')
+        article_frame.date_label.configure(text=f"🕒 {self.format_news_date(pub_date)}" if pub_date else "")
+        
+        source = article.get('author', 'Financial News')
+        article_frame.source_label.configure(text=f"📰 {source}" if source else "")
+
+    def format_news_date(self, pub_date):
+        """Readable publish date for an article card"""
+        try:
+            # Handle different date formats
+            if 'T' in pub_date:
+                date_obj = datetime.fromisoformat(pub_date.replace('Z', '+00:00'))
+            else:
+                date_obj = datetime.strptime(pub_date[:19], "%Y-%m-%d %H:%M:%S")
+
+            return date_obj.strftime("%b %d, %Y • %I:%M %p")
+        except:
+            return pub_date[:16] if len(pub_date) > 16 else pub_date
+
+    def create_news_search(self):
+        """Create the news archive search bar with its watchlist symbol filter"""
+        self.news_search_frame = ctk.CTkFrame(self.main_frame, fg_color="transparent")
+        self.news_search_frame.pack(pady=(0, 5), padx=15, fill="x")
+        self.news_articles.append(self.news_search_frame)
+        
+        self.news_search_entry = ctk.CTkEntry(
+            self.news_search_frame,
+            placeholder_text="Search past headlines, e.g. RBI rate, NVDA earnings",
+            height=32
+        )
+        self.news_search_entry.pack(side="left", padx=5, fill="x", expand=True)
+        self.news_search_entry.bind("<KeyRelease>", lambda event: self.schedule_news_search())
+        
+        self.news_symbol_filter = ctk.CTkOptionMenu(
+            self.news_search_frame,
+            values=["All symbols"] + self.watchlist.symbols,
+            command=lambda choice: self.schedule_news_search(),
+            font=("Arial", 12),
+            height=32,
+            width=140
+        )
+        self.news_symbol_filter.pack(side="left", padx=5)
+        
+        # Packed under the search bar only while there are results to show
+        self.news_results_frame = ctk.CTkFrame(self.main_frame, corner_radius=12)
+        self.news_articles.append(self.news_results_frame)
+
+    def schedule_news_search(self):
+        """Search shortly after typing pauses"""
+        if self.news_search_job is not None:
+            self.root.after_cancel(self.news_search_job)
+        self.news_search_job = self.root.after(150, self.run_news_search)
+
+    def run_news_search(self):
+        """Search the news archive in the background"""
+        self.news_search_job = None
+        query = self.news_search_entry.get().strip()
+        choice = self.news_symbol_filter.get()
+        symbol = None if choice == "All symbols" else choice
+        
+        # Newer searches supersede results still on their way
+        self.news_search_id += 1
+        search_id = self.news_search_id
+        if not query and symbol is None:
+            self.news_results_frame.pack_forget()
+            return
+        
+        self.fetcher.submit_blocking(
+            self.news_store.search, query, symbol,
+            on_success=lambda results: self.show_news_results(search_id, results),
+            on_error=lambda error: print(f"Error searching news: {error}"),
+            root=self.root
+        )
+
+    def show_news_results(self, search_id, results):
+        """Show archive search results as compact rows under the search bar"""
+        if search_id != self.news_search_id or not self.news_results_frame.winfo_exists():
+            return
+        for widget in self.news_results_frame.winfo_children():
+            widget.destroy()
+        
+        ctk.CTkLabel(
+            self.news_results_frame,
+            text=f"🔍 {len(results)} archived article{'s' if len(results) != 1 else ''}",
+            font=("Arial", 13, "bold"),
+            text_color=("#1f538d", "#4a9eff")
+        ).pack(pady=(10, 5), padx=15, anchor="w")
+        
+        for article in results:
+            ctk.CTkLabel(
+                self.news_results_frame,
+                text=clean_html(article.get('title', 'No title')),
+                font=("Arial", 13, "bold"),
+                wraplength=720,
+                justify="left",
+                text_color=("#1a1a1a", "#ffffff")
+            ).pack(padx=15, anchor="w")
+            meta = [self.format_news_date(article.get('pubDate', '')), article.get('author', '')]
+            ctk.CTkLabel(
+                self.news_results_frame,
+                text=" • ".join(part for part in meta if part),
+                font=("Arial", 11),
+                text_color=("#718096", "#a0aec0")
+            ).pack(pady=(0, 6), padx=15, anchor="w")
+        
+        self.news_results_frame.pack(pady=(0, 10), padx=15, fill="x", after=self.news_search_frame)
+
+    def refresh_news(self):
+        """Fetch only new financial news and merge it into what is shown"""
+        self.news_refresh_button.configure(state="disabled", text="🔄 Checking for new articles...")
+        
+        # Retrying the news supersedes refreshes still on their way
+        self.news_refresh_id += 1
+        refresh_id = self.news_refresh_id
+        self.fetcher.submit(
+            self.fetch_financial_news(refresh_id),
+            on_success=lambda result: self.finish_news_refresh(refresh_id, result),
+            on_error=lambda error: self.on_news_refresh_error(refresh_id, error),
+            root=self.root
+        )
+
+    def is_current_news_refresh(self, refresh_id):
+        """Whether a refresh's results still have a live news list to go into"""
+        return refresh_id == self.news_refresh_id and self.news_grid.winfo_exists()
+
+    def insert_new_articles(self, refresh_id, articles):
+        """Merge newly arrived articles in by publish time and rebind the visible rows"""
+        if not self.is_current_news_refresh(refresh_id):
+            return
+        self.news_items = rank_articles(self.news_items + list(articles))[:NEWS_LIMIT]
+        self.news_grid.set_items(self.news_items)
+
+    def finish_news_refresh(self, refresh_id, result):
+        """Report a finished refresh on the refresh button"""
+        if not self.is_current_news_refresh(refresh_id):
+            return
+        articles, errors = result
+        for name, error in errors.items():
+            print(f"Error fetching {name} news: {error}")
+
+        if errors and not articles and not self.news_items:
+            self.news_refresh_button.configure(state="normal", text="🔄 Refresh Financial News")
+            self.on_news_error(next(iter(errors.values())))
+            return
+
+        status = f"{len(articles)} new" if articles else "Up to date"
+        if errors:
+            status += f", {len(errors)} feed{'s' if len(errors) > 1 else ''} unavailable"
+        self.news_refresh_button.configure(state="normal", text=f"🔄 Refresh Financial News ({status})")
+
+    def on_news_refresh_error(self, refresh_id, error):
+        """Keep the shown articles when a refresh fails and offer another try"""
+        print(f"Error refreshing financial news: {error}")
+        if not self.is_current_news_refresh(refresh_id):
+            return
+        self.news_refresh_button.configure(state="normal", text="❌ Refresh failed - try again")
 
     def refresh_stock_data(self):
         """Refresh all stock and index data"""
-        # Update stock widgets to show loading
-        if hasattr(self, 'stock_widgets'):
-            for symbol, widget_info in self.stock_widgets.items():
-                widget_info['price_label'].configure(text="Updating...")
-                widget_info['change_label'].configure(text="")
+        # Update stock cards to show loading
+        if hasattr(self, 'stock_grid'):
+            self.quote_table.clear()
+            self.stock_placeholder = "Updating..."
+            self.stock_grid.refresh()
         
         # Update index widgets to show loading  
         if hasattr(self, 'index_widgets'):
@@ -744,10 +1071,10 @@ class GUI:
                 widget_info['value_label'].configure(text="Updating...")
                 widget_info['change_label'].configure(text="")
         
-        # Reload data in background
-        threading.Thread(target=self.load_stock_data, daemon=True).start()
-        threading.Thread(target=self.load_index_data, daemon=True).start()
-        threading.Thread(target=self.load_chart_data, daemon=True).start()
+        # Reload data in background, fetching new bars even if the cache is fresh
+        self.fetcher.submit_blocking(self.load_stock_data, True)
+        self.fetcher.submit_blocking(self.load_index_data, True)
+        self.fetcher.submit_blocking(self.load_chart_data, True)
 
     def show_error(self, error_message):
         """Display error message for financial news"""
@@ -785,7 +1112,9 @@ class GUI:
             except:
                 pass
         
+        self.news_items = []
         self.news_articles.clear()
+        self.news_refresh_id += 1
         
         # Reload news
         self.load_news()
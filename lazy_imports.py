@@ -0,0 +1,121 @@
+"""
+Lazy Imports Module
+Description: Defers heavy imports (yfinance, pandas, matplotlib, the view
+modules) until first use so the window shell appears quickly. Run this file
+directly for a startup-time benchmark with an import-time breakdown.
+"""
+
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+# Seconds spent importing each lazily loaded module
+IMPORT_TIMES = {}
+
+# Libraries that must not be imported just to show the shell
+HEAVY_MODULES = ("yfinance", "pandas", "matplotlib")
+
+# Import budget for the main module (the shell must appear within ~200 ms)
+STARTUP_BUDGET_MS = 200
+
+_import_lock = threading.RLock()
+
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access"""
+
+    def __init__(self, name):
+        self.__dict__["_name"] = name
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        module = self.__dict__["_module"]
+        if module is None:
+            with _import_lock:
+                module = self.__dict__["_module"]
+                if module is None:
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    IMPORT_TIMES[self._name] = time.perf_counter() - start
+                    self.__dict__["_module"] = module
+        return module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(self._load(), attr, value)
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_module"] is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """Get a placeholder for a module that is imported on first use"""
+    return LazyModule(name)
+
+
+def startup_report(module="finsight_main"):
+    """Import a module in a fresh interpreter and report its import cost
+
+    Returns (total_ms, heavy modules that got loaded, [(top-level import, ms)]).
+    """
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "print((time.perf_counter() - start) * 1000)\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+
+    total_line, heavy_line = result.stdout.splitlines()[-2:]
+
+    # "import time: self [us] | cumulative | imported package" - children are
+    # printed (indented) before their parent, so collect the direct imports
+    # seen since the previous top-level line
+    breakdown = []
+    children = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            children.append((name.strip(), int(cumulative) / 1000))
+        elif depth == 0:
+            if name.strip() == module:
+                breakdown = children
+            children = []
+    breakdown.sort(key=lambda item: item[1], reverse=True)
+
+    return float(total_line), [m for m in heavy_line.split(",") if m], breakdown
+
+
+# Startup-time benchmark
+if __name__ == "__main__":
+    total_ms, heavy, breakdown = startup_report()
+
+    print("Slowest imports made by finsight_main (ms, measured with -X importtime):")
+    for name, ms in breakdown[:15]:
+        print(f"  {ms:8.1f}  {name}")
+
+    print(f"\nfinsight_main import: {total_ms:.1f} ms (budget {STARTUP_BUDGET_MS} ms)")
+    print(f"Heavy modules loaded at startup: {', '.join(heavy) or 'none'}")
+
+    if heavy or total_ms > STARTUP_BUDGET_MS:
+        print("Startup regression!")
+        sys.exit(1)
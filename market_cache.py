@@ -0,0 +1,189 @@
+"""
+Market Data Cache Module
+Description: Local SQLite store of daily OHLCV bars per symbol, updated
+incrementally so charts and daily changes are served from disk
+"""
+
+import os
+import time
+from datetime import date, timedelta
+
+from config import DATA_DIR
+from db import connect
+from lazy_imports import lazy_import
+
+# Heavy libraries are imported on first use
+pd = lazy_import("pandas")
+yf = lazy_import("yfinance")
+
+DEFAULT_MARKET_CACHE_PATH = os.path.join(DATA_DIR, "market_data.sqlite3")
+
+# Seconds to wait for another writer; bulk merges hold the lock longer than the other stores
+BUSY_TIMEOUT = 10
+
+OHLCV_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+class MarketDataCache:
+    """Daily OHLCV bars cached on disk
+
+    update() only downloads bars from each symbol's last cached bar onwards
+    (the last bar is refetched because it may still be forming) and merges
+    them in place. Symbols checked within max_age seconds are skipped
+    entirely, so revisiting the dashboard makes no network calls.
+    """
+
+    def __init__(self, path=DEFAULT_MARKET_CACHE_PATH, max_age=900, backfill="3mo"):
+        self.path = path
+        self.max_age = max_age
+        self.backfill = backfill
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ohlcv ("
+                " symbol TEXT NOT NULL,"
+                " date TEXT NOT NULL,"
+                " open REAL, high REAL, low REAL, close REAL, volume REAL,"
+                " PRIMARY KEY (symbol, date))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetch_log ("
+                " symbol TEXT PRIMARY KEY,"
+                " fetched_at REAL NOT NULL)"
+            )
+
+    def last_bar_date(self, symbol):
+        """Get the date of the newest cached bar for a symbol, or None"""
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            row = conn.execute("SELECT MAX(date) FROM ohlcv WHERE symbol = ?", (symbol,)).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def is_fresh(self, symbol):
+        """Check whether a symbol was updated within max_age seconds"""
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            row = conn.execute("SELECT fetched_at FROM fetch_log WHERE symbol = ?", (symbol,)).fetchone()
+        return row is not None and time.time() - row[0] < self.max_age
+
+    def update(self, symbols, force=False):
+        """Download and merge new bars for stale symbols; returns the symbols fetched"""
+        symbols = [symbol for symbol in symbols if force or not self.is_fresh(symbol)]
+        if not symbols:
+            return []
+
+        # Group symbols by where their download has to start
+        groups = {}
+        for symbol in symbols:
+            groups.setdefault(self.last_bar_date(symbol), []).append(symbol)
+
+        for start, group in groups.items():
+            if start is None:
+                data = yf.download(group, period=self.backfill, interval="1d", group_by="column",
+                                   auto_adjust=False, threads=True, progress=False)
+            else:
+                data = yf.download(group, start=start.isoformat(), end=(date.today() + timedelta(days=1)).isoformat(),
+                                   interval="1d", group_by="column", auto_adjust=False, threads=True, progress=False)
+            self._merge(data, group)
+        return symbols
+
+    def _merge(self, data, symbols):
+        """Upsert downloaded bars and mark the symbols that got bars as fetched
+
+        Symbols the download returned nothing for (e.g. when offline) stay
+        unmarked, so the next update() retries them.
+        """
+        rows = []
+        fetched = []
+        if data is not None and not data.empty:
+            for symbol in symbols:
+                bars = self._symbol_frame(data, symbol, len(symbols))
+                if bars is None or bars.empty:
+                    continue
+                fetched.append(symbol)
+                for day, bar in bars.iterrows():
+                    rows.append((
+                        symbol, day.date().isoformat(),
+                        *(None if pd.isna(bar[column]) else float(bar[column]) for column in OHLCV_COLUMNS)
+                    ))
+
+        fetched_at = time.time()
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            conn.executemany("INSERT OR REPLACE INTO ohlcv VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany(
+                "INSERT OR REPLACE INTO fetch_log VALUES (?, ?)",
+                [(symbol, fetched_at) for symbol in fetched]
+            )
+
+    @staticmethod
+    def _symbol_frame(data, symbol, symbol_count):
+        """Pull one symbol's OHLCV columns out of a yf.download frame"""
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(1):
+                return None
+            bars = data.xs(symbol, axis=1, level=1)
+        elif symbol_count == 1:
+            bars = data
+        else:
+            return None
+        bars = bars.reindex(columns=OHLCV_COLUMNS)
+        return bars.dropna(subset=["Close"])
+
+    def history(self, symbol, start=None, days=None):
+        """Get cached bars as a DataFrame indexed by date (Open/High/Low/Close/Volume)"""
+        if days is not None:
+            start = date.today() - timedelta(days=days)
+        query = "SELECT date, open, high, low, close, volume FROM ohlcv WHERE symbol = ?"
+        params = [symbol]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start.isoformat())
+        query += " ORDER BY date"
+
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        frame = pd.DataFrame(rows, columns=["Date"] + OHLCV_COLUMNS)
+        frame["Date"] = pd.to_datetime(frame["Date"])
+        return frame.set_index("Date")
+
+    def first_bar_date(self, symbol):
+        """Get the date of the oldest cached bar for a symbol, or None"""
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            row = conn.execute("SELECT MIN(date) FROM ohlcv WHERE symbol = ?", (symbol,)).fetchone()
+        return date.fromisoformat(row[0]) if row and row[0] else None
+
+    def ensure_history(self, symbol, years):
+        """Backfill a symbol so the cache covers at least the last `years` years
+
+        Only downloads when the oldest cached bar is newer than that; the
+        incremental update() path is unaffected.
+        """
+        start = date.today() - timedelta(days=int(years * 365.25))
+        first = self.first_bar_date(symbol)
+        if first is not None and first <= start + timedelta(days=7):
+            return False
+        data = yf.download(symbol, start=start.isoformat(), end=(date.today() + timedelta(days=1)).isoformat(),
+                           interval="1d", group_by="column", auto_adjust=False, threads=True, progress=False)
+        self._merge(data, [symbol])
+        return True
+
+    def monthly_returns(self, symbol, years=20):
+        """Get month-end to month-end close returns over the last `years` years as a NumPy array"""
+        self.ensure_history(symbol, years)
+        closes = self.history(symbol, days=int(years * 365.25))["Close"].dropna()
+        month_end = closes.groupby(closes.index.to_period("M")).last()
+        # The current month is still forming
+        month_end = month_end[month_end.index < pd.Timestamp.today().to_period("M")]
+        return month_end.pct_change().dropna().to_numpy()
+
+    def last_closes(self, symbol, count=2):
+        """Get the last `count` cached closes, oldest first"""
+        with connect(self.path, timeout=BUSY_TIMEOUT) as conn:
+            rows = conn.execute(
+                "SELECT close FROM ohlcv WHERE symbol = ? AND close IS NOT NULL"
+                " ORDER BY date DESC LIMIT ?",
+                (symbol, count)
+            ).fetchall()
+        return [row[0] for row in reversed(rows)]
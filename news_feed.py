@@ -0,0 +1,318 @@
+"""
+News Feed Module
+Description: Aggregates several financial RSS/Atom feeds, fetched concurrently
+on the shared fetch loop with a timeout per feed. Feeds are parsed directly
+(no proxy service), deduplicated by GUID/link and by near-identical headline
+across sources, and handed over feed by feed as each one lands.
+"""
+
+import asyncio
+import re
+import xml.etree.ElementTree as ET
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from config import NEWS_FEED_TIMEOUT, NEWS_FEEDS
+from fetch_client import FetchError, get_fetch_client
+
+# Publish times are normalised to this (UTC) format, so they sort as text
+PUBLISHED_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Headlines sharing at least this fraction of their words are the same story
+NEAR_DUPLICATE_THRESHOLD = 0.75
+
+# Headlines remembered for cross-source dedup
+HEADLINE_MEMORY = 1000
+
+HEADLINE_STOPWORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or says that the to was will with".split()
+)
+
+
+def _local_name(tag):
+    """Tag without its XML namespace"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _child_text(element, *names):
+    """Text of the first child with one of the given local names ('' if none)"""
+    for child in element:
+        if _local_name(child.tag) in names and (child.text or "").strip():
+            return child.text.strip()
+    return ""
+
+
+def _atom_link(entry):
+    for child in entry:
+        if _local_name(child.tag) == "link" and child.get("rel", "alternate") == "alternate":
+            return child.get("href", "")
+    return ""
+
+
+def normalise_published(text):
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into PUBLISHED_FORMAT, UTC ('' if unparseable)"""
+    if not text:
+        return ""
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return ""
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime(PUBLISHED_FORMAT)
+
+
+def parse_feed(content, source):
+    """Parse an RSS 2.0 or Atom document into article dicts
+
+    Articles use the keys the dashboard and NewsStore expect: title,
+    description, link, guid, pubDate and author (the feed's name).
+    """
+    try:
+        root = ET.fromstring(content)
+    except ET.ParseError as e:
+        raise FetchError(f"Unreadable feed from {source}: {e}")
+
+    articles = []
+    for element in root.iter():
+        kind = _local_name(element.tag)
+        if kind == "item":
+            link = _child_text(element, "link")
+            article = {
+                'title': _child_text(element, "title"),
+                'description': _child_text(element, "description", "encoded"),
+                'link': link,
+                'guid': _child_text(element, "guid") or link,
+                'pubDate': normalise_published(_child_text(element, "pubDate", "date")),
+            }
+        elif kind == "entry":
+            link = _atom_link(element)
+            article = {
+                'title': _child_text(element, "title"),
+                'description': _child_text(element, "summary", "content"),
+                'link': link,
+                'guid': _child_text(element, "id") or link,
+                'pubDate': normalise_published(_child_text(element, "published", "updated")),
+            }
+        else:
+            continue
+        if article['title']:
+            article['author'] = source
+            articles.append(article)
+    return articles
+
+
+def headline_words(title):
+    """Significant lower-case words of a headline"""
+    return frozenset(
+        word for word in re.findall(r"[a-z0-9]+", title.lower()) if word not in HEADLINE_STOPWORDS
+    )
+
+
+def is_near_duplicate(words, other_words, threshold=NEAR_DUPLICATE_THRESHOLD):
+    """Whether two headlines' word sets overlap enough (Jaccard) to be one story"""
+    if not words or not other_words:
+        return words == other_words
+    return len(words & other_words) / len(words | other_words) >= threshold
+
+
+def rank_articles(articles):
+    """Sort articles newest first"""
+    return sorted(articles, key=lambda article: article.get('pubDate', ''), reverse=True)
+
+
+class NewsAggregator:
+    """Fetches every configured feed at once and yields only new, distinct articles
+
+    feeds is a list of {"name", "url"} dicts, optionally with a "timeout"
+    in seconds. Each feed is fetched conditionally (ETag/Last-Modified from
+    the store) and bounded by its own timeout, so a slow or dead source is
+    reported and skipped without delaying the others.
+    """
+
+    def __init__(self, store, feeds=NEWS_FEEDS, client=None, timeout=NEWS_FEED_TIMEOUT):
+        self.store = store
+        self.feeds = list(feeds)
+        self.client = client or get_fetch_client()
+        self.timeout = timeout
+        self._headlines = None
+
+    async def fetch_feed(self, feed):
+        """Fetch and parse one feed: (articles, response headers), ([], None) when it has not changed
+
+        The headers carry the feed's new validators; they are saved only
+        once the articles are archived, so a failed store is fetched again.
+        """
+        url = feed["url"]
+        timeout = feed.get("timeout", self.timeout)
+        headers = await self.client.run_blocking(self.store.validators, url)
+        response = await asyncio.wait_for(
+            self.client.get(url, headers=headers, timeout=timeout, retries=0), timeout
+        )
+        if response.status_code == 304:
+            return [], None
+        if response.status_code != 200:
+            raise FetchError(f"{feed['name']} returned status code: {response.status_code}")
+
+        articles = await self.client.run_blocking(parse_feed, response.content, feed["name"])
+        return articles, response.headers
+
+    def _distinct(self, articles):
+        """Drop articles whose headline repeats one already taken (from any source)"""
+        distinct = []
+        for article in rank_articles(articles):
+            words = headline_words(article['title'])
+            if any(is_near_duplicate(words, seen) for seen in self._headlines):
+                continue
+            self._headlines.append(words)
+            distinct.append(article)
+        return distinct
+
+    async def _fetch_named(self, feed):
+        """(feed, articles, headers, error) for one feed, so failures stay per feed"""
+        try:
+            return (feed, *await self.fetch_feed(feed), None)
+        except Exception as e:
+            return feed, [], None, e
+
+    async def fetch_all(self, on_articles=None):
+        """Fetch every feed concurrently and return (new articles newest first, errors)
+
+        on_articles(articles) is called on the fetch loop with each feed's
+        new articles as soon as that feed lands. errors maps feed names to
+        the exception that stopped them.
+        """
+        if self._headlines is None:
+            recent = await self.client.run_blocking(self.store.recent, HEADLINE_MEMORY)
+            self._headlines = deque((headline_words(article.get('title', '')) for article in recent),
+                                    maxlen=HEADLINE_MEMORY)
+
+        collected, errors = [], {}
+        for done in asyncio.as_completed([self._fetch_named(feed) for feed in self.feeds]):
+            feed, articles, headers, error = await done
+            if error is not None:
+                errors[feed["name"]] = error
+                continue
+            # GUID dedup first, so repeat fetches skip the headline comparisons
+            new = self._distinct(await self.client.run_blocking(self.store.add_new, articles))
+            if headers is not None:
+                await self.client.run_blocking(self.store.save_validators, feed["url"], headers)
+            if new:
+                collected.extend(new)
+                if on_articles is not None:
+                    on_articles(new)
+        return rank_articles(collected), errors
+
+
+# Fixture feed check: local RSS and Atom feeds, one too slow, one repeating a story
+if __name__ == "__main__":
+    import os
+    import sqlite3
+    import tempfile
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    from news_store import NewsStore
+
+    FIXTURES = {
+        "/rss": ("""<?xml version="1.0"?><rss version="2.0"><channel><title>Wire</title>
+            <item><title>Fed holds rates steady as inflation cools</title><link>http://wire/1</link>
+            <guid>wire-1</guid><pubDate>Tue, 14 Oct 2025 14:00:00 GMT</pubDate>
+            <description>&lt;p&gt;The central bank kept rates unchanged.&lt;/p&gt;</description></item>
+            <item><title>Oil slips on demand worries</title><link>http://wire/2</link>
+            <pubDate>Tue, 14 Oct 2025 09:30:00 -0400</pubDate></item>
+            </channel></rss>""", 0),
+        "/atom": ("""<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Desk</title>
+            <entry><title>The Fed holds rates steady as inflation cools</title><id>desk-9</id>
+            <link href="http://desk/9"/><updated>2025-10-14T14:05:00Z</updated></entry>
+            <entry><title>NVDA earnings beat estimates</title><id>desk-10</id>
+            <link href="http://desk/10"/><published>2025-10-14T15:00:00+00:00</published>
+            <summary>Data-centre revenue doubled.</summary></entry>
+            </feed>""", 0),
+        "/slow": ("""<rss><channel><item><title>Late story</title></item></channel></rss>""", 3),
+    }
+
+    # The RSS feed validates by ETag, the others by Last-Modified
+    LAST_MODIFIED = "Tue, 14 Oct 2025 15:00:00 GMT"
+    statuses = []
+
+    class FixtureHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body, delay = FIXTURES[self.path]
+            time.sleep(delay)
+            if self.path == "/rss":
+                validator, current = "ETag", f'"{self.path}"'
+                unchanged = self.headers.get("If-None-Match") == current
+            else:
+                validator, current = "Last-Modified", LAST_MODIFIED
+                unchanged = self.headers.get("If-Modified-Since") == current
+            status = 304 if unchanged else 200
+            statuses.append((self.path, status))
+
+            self.send_response(status)
+            self.send_header(validator, current)
+            self.end_headers()
+            if status == 200:
+                self.wfile.write(body.encode("utf-8"))
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    store = NewsStore(os.path.join(tempfile.mkdtemp(), "news.sqlite3"))
+    aggregator = NewsAggregator(store, feeds=[
+        {"name": "Wire", "url": f"{base}/rss"},
+        {"name": "Desk", "url": f"{base}/atom"},
+        {"name": "Slow", "url": f"{base}/slow", "timeout": 1},
+    ])
+
+    start = time.perf_counter()
+    arrivals = []
+    articles, errors = aggregator.client.run(aggregator.fetch_all(
+        lambda batch: arrivals.append((time.perf_counter() - start, [article['author'] for article in batch]))
+    ))
+    elapsed = time.perf_counter() - start
+    for at, sources in arrivals:
+        print(f"+{at * 1000:.0f} ms: {len(sources)} from {sources[0]}")
+    for article in articles:
+        print(f"{article['pubDate']}  {article['author']:<5} {article['title']}")
+    print(f"Errors: {', '.join(f'{name}: {type(e).__name__}' for name, e in errors.items())} ({elapsed:.2f} s)")
+
+    # The Fed story is kept once, from whichever source landed first
+    assert len(articles) == 3 and articles[0]['title'] == "NVDA earnings beat estimates"
+    assert set(errors) == {"Slow"} and elapsed < 2
+
+    # A second pass is conditional: the unchanged feeds answer 304 and nothing is parsed
+    statuses.clear()
+    again, _ = aggregator.client.run(aggregator.fetch_all())
+    conditional = sorted(entry for entry in statuses if entry[0] != "/slow")
+    print(f"Second pass: {conditional}")
+    assert again == [] and conditional == [("/atom", 304), ("/rss", 304)]
+
+    # Validators are only saved once the articles are archived, so a failed
+    # store is fetched in full next time
+    store = NewsStore(os.path.join(tempfile.mkdtemp(), "news.sqlite3"))
+    aggregator = NewsAggregator(store, feeds=[{"name": "Wire", "url": f"{base}/rss"}])
+    add_new = store.add_new
+
+    def failing_add_new(articles):
+        store.add_new = add_new
+        raise sqlite3.OperationalError("database is locked")
+
+    store.add_new = failing_add_new
+    try:
+        aggregator.client.run(aggregator.fetch_all())
+    except sqlite3.OperationalError:
+        pass
+    statuses.clear()
+    retried, _ = aggregator.client.run(aggregator.fetch_all())
+    assert len(retried) == 2 and statuses == [("/rss", 200)]
+    server.shutdown()
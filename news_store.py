@@ -0,0 +1,346 @@
+"""
+News Store Module
+Description: Local SQLite archive of every news article fetched, keyed by a
+GUID/link hash, with an FTS5 full-text index over the cleaned titles and
+descriptions, ticker tags for filtering by watchlist symbol, and each feed's
+ETag/Last-Modified validators so refreshes send conditional requests
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from functools import lru_cache
+
+from config import DATA_DIR
+from db import connect
+
+DEFAULT_NEWS_STORE_PATH = os.path.join(DATA_DIR, "news.sqlite3")
+
+# Bumped when the tables change; older stores are only a cache of the feeds,
+# so they are rebuilt rather than migrated
+SCHEMA_VERSION = 2
+
+# Matches ranked per search (the most recently archived ones)
+SEARCH_WINDOW = 5000
+
+# Company names that tag an article with a symbol (besides the symbol itself)
+TICKER_ALIASES = {
+    "AAPL": ("Apple",),
+    "GOOGL": ("Alphabet", "Google"),
+    "MSFT": ("Microsoft",),
+    "TSLA": ("Tesla",),
+    "AMZN": ("Amazon",),
+    "NVDA": ("Nvidia",),
+    "META": ("Meta Platforms", "Facebook"),
+    "NFLX": ("Netflix",),
+    "RELIANCE.NS": ("Reliance Industries",),
+    "TCS.NS": ("Tata Consultancy",),
+    "INFY.NS": ("Infosys",),
+    "HDFCBANK.NS": ("HDFC Bank",),
+}
+
+# Always tags: $NVDA cashtags and (NASDAQ: NVDA) style exchange references
+TICKER_MENTION = re.compile(r"\$([A-Z]{1,5})\b|\((?:NASDAQ|NYSE|AMEX|NSE|BSE)\s*:\s*([A-Z][A-Z.]{0,9})\)")
+
+
+def article_key(article):
+    """Stable dedup key for an article: hash of its GUID, else its link, else its title"""
+    identity = article.get('guid') or article.get('link') or article.get('title', '')
+    return hashlib.sha1(identity.strip().encode("utf-8")).hexdigest()
+
+
+def clean_html(text):
+    """Plain text of an HTML fragment (tags removed, entities decoded, spaces collapsed)"""
+    return " ".join(html.unescape(re.sub(r"<[^>]+>", " ", text or "")).split())
+
+
+@lru_cache(maxsize=32)
+def _symbol_lookup(symbols):
+    """({word: symbol} for upper-case symbol words, {lower-case alias words: symbol}, longest alias)"""
+    plain = {}
+    aliases = {}
+    for symbol in symbols:
+        base = symbol.split(".")[0]
+        if len(base) > 1:
+            plain[base] = symbol
+        for name in TICKER_ALIASES.get(symbol, ()):
+            aliases[tuple(name.lower().split())] = symbol
+    return plain, aliases, max((len(words) for words in aliases), default=0)
+
+
+def tickers_in(text, symbols=()):
+    """Symbols an article mentions
+
+    Cashtags and exchange references always count; the given symbols
+    (e.g. the watchlist) also match as upper-case words or by their
+    TICKER_ALIASES company names.
+    """
+    tags = {cashtag or listed for cashtag, listed in TICKER_MENTION.findall(text)}
+    plain, aliases, longest = _symbol_lookup(tuple(sorted(set(symbols) | set(TICKER_ALIASES))))
+    words = re.findall(r"\w+", text)
+    tags.update(plain[word] for word in words if word in plain)
+
+    # Company names, matched as runs of one or more lower-cased words
+    lowered = [word.lower() for word in words]
+    for size in range(1, longest + 1):
+        for start in range(len(lowered) - size + 1):
+            symbol = aliases.get(tuple(lowered[start:start + size]))
+            if symbol is not None:
+                tags.add(symbol)
+    return tags
+
+
+def ticker_token(symbol):
+    """Single FTS token for a symbol in the index's tickers column (RELIANCE.NS -> RELIANCENS)"""
+    return re.sub(r"\W", "", symbol)
+
+
+def match_expression(query):
+    """FTS5 query for free text: every word must match, the last one as a prefix"""
+    words = re.findall(r"\w+", query.lower())
+    if not words:
+        return None
+    return " ".join(f'"{word}"' for word in words[:-1]) + (" " if len(words) > 1 else "") + f'"{words[-1]}"*'
+
+
+class NewsStore:
+    """SQLite archive of seen articles, their full-text index and ticker tags
+
+    Articles are kept as JSON alongside their publish time, so the newest
+    ones can be shown straight from disk when a feed has nothing new. Ticker
+    tags live in news_tickers and are mirrored into the index's tickers
+    column, so a symbol filter is part of the full-text match.
+    symbols is a callable returning the symbols to tag new articles with
+    (the watchlist); TICKER_ALIASES symbols are always tagged.
+    """
+
+    def __init__(self, path=DEFAULT_NEWS_STORE_PATH, symbols=None):
+        self.path = path
+        self.symbols = symbols or (lambda: ())
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with connect(self.path) as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                for table in ("news_articles", "news_index", "news_tickers", "feed_validators"):
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS news_articles ("
+                " id INTEGER PRIMARY KEY,"
+                " key TEXT NOT NULL UNIQUE,"
+                " published TEXT NOT NULL,"
+                " seen_at REAL NOT NULL,"
+                " article TEXT NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS news_articles_published ON news_articles (published)")
+            conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS news_index"
+                " USING fts5(title, description, tickers, tokenize='porter unicode61')"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS news_tickers ("
+                " symbol TEXT NOT NULL,"
+                " article INTEGER NOT NULL,"
+                " PRIMARY KEY (symbol, article)) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS feed_validators ("
+                " url TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " last_modified TEXT)"
+            )
+
+    def add_new(self, articles):
+        """Archive articles and return only those not seen before (in feed order)
+
+        Each new article is indexed by its cleaned title and description
+        and tagged with the symbols it mentions.
+        """
+        keyed = {}
+        for article in articles:
+            keyed.setdefault(article_key(article), article)
+        if not keyed:
+            return []
+
+        symbols = list(self.symbols())
+        with connect(self.path) as conn:
+            placeholders = ",".join("?" * len(keyed))
+            seen = {
+                row[0] for row in conn.execute(
+                    f"SELECT key FROM news_articles WHERE key IN ({placeholders})", list(keyed)
+                )
+            }
+            new = [(key, article) for key, article in keyed.items() if key not in seen]
+            now = time.time()
+            for key, article in new:
+                article_id = conn.execute(
+                    "INSERT INTO news_articles (key, published, seen_at, article) VALUES (?, ?, ?, ?)",
+                    (key, article.get('pubDate', ''), now, json.dumps(article))
+                ).lastrowid
+                title = clean_html(article.get('title', ''))
+                description = clean_html(article.get('description', '') or article.get('content', ''))
+                tags = tickers_in(f"{title} {description}", symbols)
+                conn.execute(
+                    "INSERT INTO news_index (rowid, title, description, tickers) VALUES (?, ?, ?, ?)",
+                    (article_id, title, description, " ".join(ticker_token(symbol) for symbol in tags))
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO news_tickers VALUES (?, ?)",
+                    [(symbol, article_id) for symbol in tags]
+                )
+        return [article for _, article in new]
+
+    def tag_symbols(self, symbols):
+        """Tag already archived articles that mention symbols (e.g. ones just added to the watchlist)"""
+        with connect(self.path) as conn:
+            for symbol in symbols:
+                words = [symbol.split(".")[0]] + list(TICKER_ALIASES.get(symbol, ()))
+                candidates = conn.execute(
+                    "SELECT rowid, title, description FROM news_index WHERE news_index MATCH ?",
+                    ("{title description} : (" + " OR ".join(f'"{word}"' for word in words) + ")",)
+                ).fetchall()
+                for article_id, title, description in candidates:
+                    if symbol not in tickers_in(f"{title} {description}", [symbol]):
+                        continue
+                    if conn.execute("INSERT OR IGNORE INTO news_tickers VALUES (?, ?)", (symbol, article_id)).rowcount:
+                        conn.execute(
+                            "UPDATE news_index SET tickers = tickers || ' ' || ? WHERE rowid = ?",
+                            (ticker_token(symbol), article_id)
+                        )
+
+    def search(self, query="", symbol=None, limit=20):
+        """Archived articles matching query (best match first), optionally only those tagged symbol
+
+        Matches are ranked by BM25 among the SEARCH_WINDOW most recently
+        archived ones (counting only those tagged symbol, when given).
+        Query words also match the tags, so "nvda" finds Nvidia stories.
+        Without query text the newest articles (for the symbol) come back.
+        """
+        expression = match_expression(query)
+        if expression is None:
+            sql = "SELECT a.article FROM news_articles a"
+            params = []
+            if symbol:
+                sql += " JOIN news_tickers t ON t.article = a.id WHERE t.symbol = ?"
+                params.append(symbol)
+            sql += " ORDER BY a.published DESC LIMIT ?"
+        else:
+            # The symbol filter is part of the match, so FTS5 intersects it
+            # with the query before the window is counted
+            if symbol:
+                expression = f'({expression}) AND tickers : "{ticker_token(symbol)}"'
+
+            # Rank only the newest SEARCH_WINDOW matches (FTS5 walks rowids
+            # newest first and stops), so very common words stay fast
+            sql = ("SELECT a.article FROM news_index"
+                   " JOIN news_articles a ON a.id = news_index.rowid"
+                   " WHERE news_index MATCH ? AND news_index.rowid >= coalesce(("
+                   "  SELECT rowid FROM news_index WHERE news_index MATCH ?"
+                   "  ORDER BY rowid DESC LIMIT 1 OFFSET ?), 0)"
+                   " ORDER BY news_index.rank LIMIT ?")
+            params = [expression, expression, SEARCH_WINDOW - 1]
+        params.append(limit)
+
+        with connect(self.path) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def recent(self, limit=8):
+        """Get the newest stored articles, newest first"""
+        with connect(self.path) as conn:
+            rows = conn.execute(
+                "SELECT article FROM news_articles ORDER BY published DESC, seen_at DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def validators(self, url):
+        """Conditional request headers for a feed (empty until it has been fetched)"""
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT etag, last_modified FROM feed_validators WHERE url = ?", (url,)
+            ).fetchone()
+
+        headers = {}
+        if row is not None:
+            etag, last_modified = row
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def save_validators(self, url, response_headers):
+        """Remember a feed response's ETag / Last-Modified for the next request"""
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO feed_validators VALUES (?, ?, ?)",
+                (url, etag, last_modified)
+            )
+
+
+# Archive search benchmark
+if __name__ == "__main__":
+    import itertools
+    import random
+    import tempfile
+
+    rng = random.Random(0)
+    archive = 100000
+
+    # Zipf-like vocabulary, so common words are common and topics are rare
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    vocabulary = ["".join(rng.choices(letters, k=rng.randint(3, 9))) for _ in range(20000)]
+    topics = ("RBI rate cut", "NVDA earnings beat", "Tesla deliveries", "crude oil OPEC", "Sensex rally",
+              "Fed holds rates", "rupee slips", "Apple iPhone sales", "AI chips demand", "bank profit")
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+
+    def sentence(k):
+        text = rng.choices(vocabulary, cum_weights=cum_weights, k=k)
+        if rng.random() < 0.1:
+            text.insert(rng.randrange(k), rng.choice(topics))
+        return " ".join(text)
+
+    store = NewsStore(os.path.join(tempfile.mkdtemp(), "news.sqlite3"), symbols=lambda: ["NVDA", "TSLA"])
+    start = time.perf_counter()
+    for batch in range(0, archive, 5000):
+        store.add_new([
+            {
+                'guid': f"item-{i}",
+                'title': sentence(8).capitalize(),
+                'description': sentence(30),
+                'pubDate': f"2025-{1 + i % 12:02d}-{1 + i % 28:02d} {i % 24:02d}:00:00",
+            }
+            for i in range(batch, batch + 5000)
+        ])
+    print(f"Archived {archive:,} articles in {time.perf_counter() - start:.1f} s")
+
+    # The last query is the most common word: the worst case for ranking
+    for query, symbol in (("RBI rate", None), ("NVDA earnings", None), ("earn", None), ("", "TSLA"), ("chips", "NVDA"),
+                          (vocabulary[0], "NVDA"), (vocabulary[0], None)):
+        start = time.perf_counter()
+        results = store.search(query, symbol)
+        elapsed = (time.perf_counter() - start) * 1000
+        label = f"{query!r}" + (f" [{symbol}]" if symbol else "")
+        print(f"search {label}: {len(results)} results in {elapsed:.1f} ms")
+
+    assert all("rbi" in (article['title'] + article['description']).lower() for article in store.search("RBI rate"))
+
+    # The window counts only tagged matches, so a symbol rarer than the window keeps all of its own
+    with connect(store.path) as conn:
+        tagged = conn.execute(
+            "SELECT count(*) FROM news_tickers t JOIN news_articles a ON a.id = t.article"
+            " WHERE t.symbol = 'NVDA' AND a.article LIKE ?", (f"%{vocabulary[0]}%",)
+        ).fetchone()[0]
+    assert 0 < tagged < SEARCH_WINDOW and len(store.search(vocabulary[0], "NVDA", limit=archive)) == tagged
+    assert tickers_in("Nvidia (NASDAQ: NVDA) tops $AMD and Tesla", ["TSLA"]) >= {"NVDA", "AMD", "TSLA"}
+    assert store.add_new([{'guid': "item-0", 'title': "repeat"}]) == []
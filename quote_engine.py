@@ -0,0 +1,120 @@
+"""
+Quote Engine Module
+Description: Batched quote loader for the dashboard - one yfinance download
+for the whole watchlist instead of one Ticker round trip per symbol, served
+from the local market data cache
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from lazy_imports import lazy_import
+from market_cache import MarketDataCache
+
+# yfinance and the NumPy-based quote math are imported on first use
+yf = lazy_import("yfinance")
+quotes_core = lazy_import("finsight.core.quotes")
+
+
+class QuoteTable:
+    """Thread-safe symbol -> (price, change_percent) table shared by loaders and views
+
+    Writers (loaders, live feeds) may update it at any rate; the UI picks
+    up the symbols changed since its last look with take_changes, so many
+    ticks for one symbol coalesce into a single redraw.
+    """
+
+    def __init__(self):
+        self._quotes = {}
+        self._changed = set()
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def update(self, quotes):
+        """Merge a batch of quotes"""
+        with self._lock:
+            self._quotes.update(quotes)
+            self._changed.update(quotes)
+            self.version += 1
+
+    def take_changes(self):
+        """Get {symbol: quote} for symbols updated since the last call"""
+        with self._lock:
+            changes = {symbol: self._quotes[symbol] for symbol in self._changed if symbol in self._quotes}
+            self._changed.clear()
+            return changes
+
+    def get(self, symbol, default=None):
+        with self._lock:
+            return self._quotes.get(symbol, default)
+
+    def remove(self, symbol):
+        with self._lock:
+            self._quotes.pop(symbol, None)
+            self._changed.discard(symbol)
+            self.version += 1
+
+    def clear(self):
+        with self._lock:
+            self._quotes.clear()
+            self._changed.clear()
+            self.version += 1
+
+    def __len__(self):
+        return len(self._quotes)
+
+
+class QuoteEngine:
+    """Fetch last price and daily change for many symbols at once"""
+
+    def __init__(self, cache=None, max_fallback_workers=4):
+        # Daily bars come from (and are incrementally added to) the local cache
+        self.cache = cache or MarketDataCache()
+        
+        # Only symbols without usable history hit the slow Ticker.info path
+        self.max_fallback_workers = max_fallback_workers
+
+    def _info_quote(self, symbol):
+        """Fallback: read the current price from Ticker.info"""
+        try:
+            info = yf.Ticker(symbol).info
+            current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
+            if current_price:
+                return current_price, 0
+            return None
+        except Exception as e:
+            print(f"Error loading {symbol}: {e}")
+            return ("Error", 0)
+
+    def fetch_quotes(self, symbols, use_info_fallback=True, force=False):
+        """Get {symbol: (price, change_percent)} for every symbol that could be priced
+
+        Prices and changes come from the last two cached daily closes. Stale
+        symbols are first updated in one batched download (all of them when
+        force is set). Symbols without two closes fall back to Ticker.info
+        when use_info_fallback is set (in a small worker pool); otherwise
+        they are left out.
+        """
+        symbols = list(symbols)
+        quotes = {}
+        missing = []
+
+        try:
+            self.cache.update(symbols, force=force)
+        except Exception as e:
+            print(f"Error downloading quotes: {e}")
+
+        for symbol in symbols:
+            quote = quotes_core.daily_change(self.cache.last_closes(symbol, 2))
+            if quote is not None:
+                quotes[symbol] = quote
+            else:
+                missing.append(symbol)
+
+        if missing and use_info_fallback:
+            with ThreadPoolExecutor(max_workers=min(self.max_fallback_workers, len(missing))) as pool:
+                for symbol, quote in zip(missing, pool.map(self._info_quote, missing)):
+                    if quote is not None:
+                        quotes[symbol] = quote
+
+        return quotes
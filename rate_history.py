@@ -0,0 +1,300 @@
+"""
+Rate History Store
+Description: Append-only columnar store of daily exchange rates with a date
+index, for "rate on date D" lookups and multi-year conversion history
+"""
+
+import csv
+import os
+import threading
+import time
+from datetime import date
+
+import numpy as np
+
+from config import DATA_DIR
+
+DEFAULT_HISTORY_PATH = os.path.join(DATA_DIR, "fx_history")
+
+# Resampling frequencies (numpy datetime units)
+RESAMPLE_FREQUENCIES = {"W": "W", "M": "M", "Y": "Y"}
+
+# NumPy weeks start on Thursday (the 1970-01-01 epoch); shifting dates by
+# this many days before bucketing makes them start on Monday
+WEEK_START_SHIFT = np.timedelta64(3, "D")
+
+
+def split_pair(pair):
+    """Split "USD/INR", "USDINR" or ("USD", "INR") into (from, to) codes"""
+    if isinstance(pair, str):
+        pair = pair.replace("/", "").replace("-", "").upper()
+        if len(pair) != 6:
+            raise ValueError(f"Invalid currency pair: {pair}")
+        return pair[:3], pair[3:]
+    from_currency, to_currency = pair
+    return from_currency.upper(), to_currency.upper()
+
+
+def to_day(value):
+    """Convert a date, datetime, ISO string or datetime64 to datetime64[D]"""
+    if value is None:
+        return np.datetime64(date.today(), "D")
+    if isinstance(value, str):
+        value = value[:10]
+    return np.datetime64(value, "D")
+
+
+class RateHistoryStore:
+    """Daily USD-based rates stored column by column
+
+    On disk the store is a directory holding a dates.i64 index (days since
+    the epoch, sorted) and one <CODE>.f64 file of float64 rates per currency,
+    all the same length. Missing values are NaN. New days are appended to
+    every column; recording the latest day again overwrites that row in
+    place. Out-of-order data such as CSV imports is merged and the columns
+    are rewritten.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self._lock = threading.Lock()
+        self._load()
+
+    def _dates_path(self):
+        return os.path.join(self.path, "dates.i64")
+
+    def _column_path(self, currency_code):
+        return os.path.join(self.path, f"{currency_code}.f64")
+
+    def _load(self):
+        """Read the date index and every column into memory"""
+        if os.path.exists(self._dates_path()):
+            days = np.fromfile(self._dates_path(), dtype=np.int64)
+        else:
+            days = np.empty(0, dtype=np.int64)
+        self.dates = days.astype("datetime64[D]")
+
+        self.columns = {}
+        for name in os.listdir(self.path):
+            if not name.endswith(".f64"):
+                continue
+            values = np.fromfile(os.path.join(self.path, name), dtype=np.float64)
+            # Pad (or trim) columns left uneven by an interrupted write
+            column = np.full(len(days), np.nan)
+            count = min(len(values), len(days))
+            column[:count] = values[:count]
+            self.columns[name[:-4]] = column
+
+    def _rewrite(self):
+        """Write the whole store back to disk"""
+        for filename, array in [(self._dates_path(), self.dates.astype(np.int64))] + [
+            (self._column_path(code), column) for code, column in self.columns.items()
+        ]:
+            temp_path = filename + ".tmp"
+            array.tofile(temp_path)
+            os.replace(temp_path, filename)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def currencies(self):
+        """Get the currency codes with recorded history"""
+        return sorted(set(self.columns) | {"USD"})
+
+    def record(self, rates, day=None):
+        """Record a USD-based rate table for a day (default: today)"""
+        day = to_day(day)
+        with self._lock:
+            count = len(self.dates)
+            if count and day < self.dates[-1]:
+                self._merge(np.array([day]), {
+                    code: np.array([rate], dtype=np.float64) for code, rate in rates.items()
+                })
+                return
+
+            if count and day == self.dates[-1]:
+                # Same day again - overwrite the last row in place
+                for code, rate in rates.items():
+                    if code == "USD":
+                        continue
+                    if code not in self.columns:
+                        self._add_column(code, count)
+                    self.columns[code][-1] = rate
+                    with open(self._column_path(code), "r+b") as f:
+                        f.seek((count - 1) * 8)
+                        f.write(np.float64(rate).tobytes())
+                return
+
+            # New latest day - append one value to every column
+            for code in rates:
+                if code != "USD" and code not in self.columns:
+                    self._add_column(code, count)
+            for code, column in self.columns.items():
+                value = np.float64(rates.get(code, np.nan))
+                self.columns[code] = np.append(column, value)
+                with open(self._column_path(code), "ab") as f:
+                    f.write(value.tobytes())
+            self.dates = np.append(self.dates, day)
+            with open(self._dates_path(), "ab") as f:
+                f.write(day.astype(np.int64).tobytes())
+
+    def _add_column(self, currency_code, length):
+        """Start a new currency column, NaN-filled for earlier days"""
+        column = np.full(length, np.nan)
+        column.tofile(self._column_path(currency_code))
+        self.columns[currency_code] = column
+
+    def _merge(self, dates, columns):
+        """Merge dated columns into the store (new values win) and rewrite it"""
+        merged_dates = np.union1d(self.dates, dates)
+        old_positions = np.searchsorted(merged_dates, self.dates)
+        new_positions = np.searchsorted(merged_dates, dates)
+
+        merged = {}
+        for code in set(self.columns) | set(columns):
+            if code == "USD":
+                continue
+            column = np.full(len(merged_dates), np.nan)
+            if code in self.columns:
+                column[old_positions] = self.columns[code]
+            if code in columns:
+                values = columns[code]
+                present = ~np.isnan(values)
+                column[new_positions[present]] = values[present]
+            merged[code] = column
+
+        self.dates = merged_dates
+        self.columns = merged
+        self._rewrite()
+
+    def import_csv(self, csv_path):
+        """Bulk import daily history from a CSV file and return the row count
+
+        The file needs a "date" column (YYYY-MM-DD) followed by one column per
+        currency holding units per 1 USD. Empty cells are treated as missing.
+        """
+        with open(csv_path, newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader)
+            codes = [code.strip().upper() for code in header[1:]]
+            rows = [row for row in reader if row]
+
+        dates = np.array([row[0].strip()[:10] for row in rows], dtype="datetime64[D]")
+        values = np.array([
+            [float(cell) if cell.strip() else np.nan for cell in row[1:len(codes) + 1]]
+            for row in rows
+        ], dtype=np.float64).reshape(len(rows), len(codes))
+
+        # Keep the last row for a repeated date
+        order = np.argsort(dates, kind="stable")
+        dates, values = dates[order], values[order]
+        last = np.append(dates[1:] != dates[:-1], True)
+        dates, values = dates[last], values[last]
+
+        with self._lock:
+            self._merge(dates, {code: values[:, i] for i, code in enumerate(codes)})
+        return len(dates)
+
+    def _usd_column(self, currency_code, start, stop):
+        """Get a USD-based column slice (USD itself is all ones)"""
+        if currency_code == "USD":
+            return np.ones(stop - start)
+        try:
+            return self.columns[currency_code][start:stop]
+        except KeyError:
+            raise KeyError(f"No history for currency: {currency_code}") from None
+
+    def _cross(self, from_currency, to_currency, start, stop):
+        """Get cross rates for rows start:stop (NaN where either side is missing)"""
+        to_values = self._usd_column(to_currency, start, stop)
+        from_values = self._usd_column(from_currency, start, stop)
+        return to_values / from_values
+
+    def rate_at(self, pair, day):
+        """Get the rate for a pair on a day (or the last recorded day before it)"""
+        from_currency, to_currency = split_pair(pair)
+        stop = int(np.searchsorted(self.dates, to_day(day), side="right"))
+        values = self._cross(from_currency, to_currency, 0, stop)
+        valid = np.flatnonzero(~np.isnan(values))
+        if len(valid) == 0:
+            return None
+        return float(values[valid[-1]])
+
+    def series(self, pair, start=None, end=None):
+        """Get (dates, rates) NumPy arrays for a pair between two days, inclusive"""
+        from_currency, to_currency = split_pair(pair)
+        lo = 0 if start is None else int(np.searchsorted(self.dates, to_day(start), side="left"))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, to_day(end), side="right"))
+
+        values = self._cross(from_currency, to_currency, lo, hi)
+        valid = ~np.isnan(values)
+        return self.dates[lo:hi][valid], values[valid]
+
+    def resample(self, pair, freq="M", start=None, end=None, how="last"):
+        """Resample a pair's series to weekly, monthly or yearly points
+
+        how is one of "last", "first", "mean", "min" or "max". Returns
+        (period start dates, values); weeks run Monday to Sunday.
+        """
+        if freq not in RESAMPLE_FREQUENCIES:
+            raise ValueError(f"Unsupported frequency: {freq}")
+        dates, values = self.series(pair, start, end)
+        if len(values) == 0:
+            return dates, values
+
+        shift = WEEK_START_SHIFT if freq == "W" else np.timedelta64(0, "D")
+        periods = (dates + shift).astype(f"datetime64[{RESAMPLE_FREQUENCIES[freq]}]")
+        starts = np.concatenate(([0], np.flatnonzero(periods[1:] != periods[:-1]) + 1))
+        labels = periods[starts].astype("datetime64[D]") - shift
+
+        if how == "last":
+            return labels, values[np.append(starts[1:] - 1, len(values) - 1)]
+        if how == "first":
+            return labels, values[starts]
+        if how == "mean":
+            counts = np.diff(np.append(starts, len(values)))
+            return labels, np.add.reduceat(values, starts) / counts
+        if how == "min":
+            return labels, np.minimum.reduceat(values, starts)
+        if how == "max":
+            return labels, np.maximum.reduceat(values, starts)
+        raise ValueError(f"Unsupported aggregation: {how}")
+
+
+# Benchmark range queries over 10+ years of daily data
+if __name__ == "__main__":
+    import tempfile
+
+    store = RateHistoryStore(tempfile.mkdtemp())
+    days = np.arange(np.datetime64("2014-01-01"), np.datetime64("2025-01-01"))
+    rng = np.random.default_rng(0)
+    codes = ["EUR", "GBP", "JPY", "INR", "CAD", "AUD", "CHF", "CNY"]
+
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["date"] + codes)
+        walk = np.exp(np.cumsum(rng.normal(0, 0.004, (len(days), len(codes))), axis=0))
+        for day, row in zip(days, walk * [0.9, 0.8, 110, 70, 1.3, 1.4, 0.95, 6.5]):
+            writer.writerow([str(day)] + [f"{rate:.6f}" for rate in row])
+
+    start = time.perf_counter()
+    imported = store.import_csv(f.name)
+    print(f"Imported {imported:,} days in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        dates, rates = store.series("USD/INR", "2015-01-01", "2024-12-31")
+    print(f"series (10y, {len(rates):,} points): {(time.perf_counter() - start) * 10:.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        store.rate_at("EUR/INR", "2019-06-15")
+    print(f"rate_at: {(time.perf_counter() - start) * 10:.3f} ms")
+
+    start = time.perf_counter()
+    for _ in range(100):
+        months, monthly = store.resample("GBP/JPY", "M")
+    print(f"resample (monthly, {len(monthly)} points): {(time.perf_counter() - start) * 10:.3f} ms")
+
+    os.remove(f.name)
@@ -0,0 +1,78 @@
+"""
+Rate Snapshot Store
+Description: Persists fetched exchange-rate tables in a local SQLite file
+so the app can start from the newest saved rates without waiting on the network
+"""
+
+import os
+import time
+
+import numpy as np
+
+from config import DATA_DIR
+from db import connect
+
+DEFAULT_RATE_STORE_PATH = os.path.join(DATA_DIR, "rates.sqlite3")
+
+
+class RateSnapshotStore:
+    """SQLite store of rate snapshots keyed by base currency and timestamp
+    
+    Each snapshot is stored compactly as a comma-separated code list plus
+    the rates packed as a float64 blob.
+    """
+    
+    def __init__(self, path=DEFAULT_RATE_STORE_PATH):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with connect(self.path) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_snapshots ("
+                " base TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " codes TEXT NOT NULL,"
+                " rates BLOB NOT NULL,"
+                " PRIMARY KEY (base, fetched_at))"
+            )
+    
+    def save(self, rates, base_currency="USD", fetched_at=None):
+        """Save a rate table and return its timestamp"""
+        if fetched_at is None:
+            fetched_at = time.time()
+        codes = list(rates.keys())
+        values = np.array([rates[code] for code in codes], dtype=np.float64)
+        
+        with connect(self.path) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_snapshots VALUES (?, ?, ?, ?)",
+                (base_currency, fetched_at, ",".join(codes), values.tobytes())
+            )
+        return fetched_at
+    
+    def latest(self, base_currency="USD"):
+        """Get (rates, fetched_at) for the newest snapshot, or None"""
+        with connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT fetched_at, codes, rates FROM rate_snapshots"
+                " WHERE base = ? ORDER BY fetched_at DESC LIMIT 1",
+                (base_currency,)
+            ).fetchone()
+        
+        if row is None:
+            return None
+        fetched_at, codes, blob = row
+        values = np.frombuffer(blob, dtype=np.float64).tolist()
+        return dict(zip(codes.split(","), values)), fetched_at
+    
+    def prune(self, keep=50, base_currency="USD"):
+        """Delete all but the newest `keep` snapshots for a base currency"""
+        with connect(self.path) as conn:
+            conn.execute(
+                "DELETE FROM rate_snapshots WHERE base = ? AND fetched_at NOT IN ("
+                " SELECT fetched_at FROM rate_snapshots WHERE base = ?"
+                " ORDER BY fetched_at DESC LIMIT ?)",
+                (base_currency, base_currency, keep)
+            )
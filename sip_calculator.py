@@ -4,14 +4,90 @@ Author: Parth Hada
 Description: Systematic Investment Plan Calculator with visualization
 """
 
+import os
+from datetime import date
+
 import customtkinter as ctk
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
 
 # Import colors from main config
 from config import COLORS
 
+# Headless SIP math
+from fetch_client import get_fetch_client
+from finsight.core.cashflow import plan_yearly_growth, simulate_plan
+from finsight.core.goals import inflation_adjusted, required_monthly, required_rate, required_years
+from finsight.core.montecarlo import monte_carlo_sip
+from finsight.core.returns import cagr, xirr, year_fractions
+from finsight.core.sip import ScenarioGrid, sip_summary, yearly_growth
+from market_cache import MarketDataCache
+
+# Scenario grid axes: monthly amounts x durations (years) x return rates (% p.a.)
+SCENARIO_AMOUNTS = np.linspace(1000, 100000, 100)
+SCENARIO_DURATIONS = np.arange(1, 41)
+SCENARIO_RATES = np.linspace(1, 25, 50)
+
+# Projection modes: constant return, lognormal Monte Carlo, or bootstrapped index history
+PROJECTION_MODES = ["Constant", "Monte Carlo", "Historical"]
+PATH_COUNTS = ["10000", "50000", "100000"]
+
+# What the goal-seek solver can solve for
+GOAL_TARGETS = ["Monthly Amount", "Return Rate", "Duration"]
+
+# Runs this large split their paths across a process pool
+POOL_PATH_THRESHOLD = 50000
+
+# Index whose monthly returns are bootstrapped in Historical mode
+HISTORICAL_INDEX = "^GSPC"
+HISTORICAL_YEARS = 30
+
+
+def parse_pauses(text):
+    """Parse pause years like "3" or "3-4, 8" into 1-based inclusive month ranges"""
+    pauses = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        first_year, last_year = int(first), int(last or first)
+        if first_year < 1 or last_year < first_year:
+            raise ValueError(f"Invalid pause: {part}")
+        pauses.append(((first_year - 1) * 12 + 1, last_year * 12))
+    return pauses
+
+
+def parse_cashflows(text):
+    """Parse "YYYY-MM-DD, amount" lines into (dates, amounts)
+
+    Amounts are as typed: investments positive, redemptions negative.
+    """
+    dates, amounts = [], []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        day, _, amount = line.partition(",")
+        dates.append(date.fromisoformat(day.strip()))
+        amounts.append(float(amount.replace("₹", "").replace(",", "").strip()))
+    if not dates:
+        raise ValueError("No cash flows entered")
+    return dates, amounts
+
+
+def format_currency(x, p):
+    """Axis formatter for rupee amounts (K / L / Cr)"""
+    if x >= 10000000:  # 1 Crore
+        return f'₹{x/10000000:.1f}Cr'
+    elif x >= 100000:  # 1 Lakh
+        return f'₹{x/100000:.1f}L'
+    elif x >= 1000:
+        return f'₹{x/1000:.0f}K'
+    else:
+        return f'₹{x:.0f}'
+
 
 class SIPCalculator(ctk.CTkFrame):
     """SIP (Systematic Investment Plan) Calculator Widget"""
@@ -110,6 +186,80 @@ class SIPCalculator(ctk.CTkFrame):
         self.return_entry.grid(row=5, column=0, padx=20, pady=(0, 20), sticky="w")
         self.return_entry.insert(0, "12")
         
+        # Projection mode (constant return or simulated paths)
+        mode_label = ctk.CTkLabel(
+            input_frame, 
+            text="Projection", 
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        )
+        mode_label.grid(row=0, column=1, sticky="w", padx=20, pady=(20, 5))
+        
+        self.mode_selector = ctk.CTkSegmentedButton(
+            input_frame,
+            values=PROJECTION_MODES,
+            font=("Segoe UI", 13),
+            selected_color=COLORS['primary']
+        )
+        self.mode_selector.grid(row=1, column=1, padx=20, pady=(0, 15), sticky="w")
+        self.mode_selector.set(PROJECTION_MODES[0])
+        
+        # Volatility for Monte Carlo mode
+        volatility_label = ctk.CTkLabel(
+            input_frame, 
+            text="Volatility (% p.a., Monte Carlo)", 
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        )
+        volatility_label.grid(row=2, column=1, sticky="w", padx=20, pady=(10, 5))
+        
+        self.volatility_entry = ctk.CTkEntry(
+            input_frame, 
+            placeholder_text="15%", 
+            width=200,
+            height=40,
+            font=("Segoe UI", 14),
+            border_width=2,
+            border_color=COLORS['border'],
+            fg_color="white"
+        )
+        self.volatility_entry.grid(row=3, column=1, padx=20, pady=(0, 15), sticky="w")
+        self.volatility_entry.insert(0, "15")
+        
+        # Number of simulated paths
+        paths_label = ctk.CTkLabel(
+            input_frame, 
+            text="Simulated Paths", 
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        )
+        paths_label.grid(row=4, column=1, sticky="w", padx=20, pady=(10, 5))
+        
+        self.paths_menu = ctk.CTkOptionMenu(
+            input_frame,
+            values=PATH_COUNTS,
+            width=200,
+            height=40,
+            font=("Segoe UI", 14),
+            fg_color=COLORS['primary']
+        )
+        self.paths_menu.grid(row=5, column=1, padx=20, pady=(0, 20), sticky="w")
+        self.paths_menu.set(PATH_COUNTS[0])
+        
+        # Plan options: annual step-up, lumpsum, pauses and withdrawals (SWP)
+        self.step_up_entry = self.create_option_entry(input_frame, "Annual Step-up (%)", "0", 0, 2)
+        self.lumpsum_entry = self.create_option_entry(input_frame, "Initial Lumpsum (₹)", "0", 2, 2)
+        self.pause_entry = self.create_option_entry(input_frame, "Pause Years (e.g. 3-4)", "", 4, 2)
+        self.withdrawal_entry = self.create_option_entry(input_frame, "Monthly Withdrawal (₹, SWP)", "0", 0, 3)
+        self.withdrawal_start_entry = self.create_option_entry(input_frame, "Withdraw After (Years)", "0", 2, 3)
+        
+        # Growth chart, built on first use and then updated in place
+        self.chart_frame = None
+        self.chart_laid_out = False
+        
+        # Latest projection request (older results are dropped)
+        self.projection_id = 0
+        
         # Calculate button with Groww green style
         calc_button = ctk.CTkButton(
             input_frame,
@@ -124,6 +274,45 @@ class SIPCalculator(ctk.CTkFrame):
         )
         calc_button.grid(row=6, column=0, padx=20, pady=(10, 25), sticky="w")
         
+        # Scenario grid button (heatmap of final corpus)
+        scenario_button = ctk.CTkButton(
+            input_frame,
+            text="Scenario Grid",
+            command=self.show_scenario_grid,
+            font=("Segoe UI", 14, "bold"),
+            height=45,
+            width=200,
+            fg_color=COLORS['primary'],
+            corner_radius=10
+        )
+        scenario_button.grid(row=6, column=1, padx=20, pady=(10, 25), sticky="w")
+        
+        # Goal-seek button (solve a plan backwards from a target corpus)
+        goal_button = ctk.CTkButton(
+            input_frame,
+            text="Goal Seek",
+            command=self.show_goal_seek,
+            font=("Segoe UI", 14, "bold"),
+            height=45,
+            width=200,
+            fg_color=COLORS['primary'],
+            corner_radius=10
+        )
+        goal_button.grid(row=6, column=2, padx=20, pady=(10, 25), sticky="w")
+        
+        # Actual returns button (XIRR of a real portfolio's cash flows)
+        actual_button = ctk.CTkButton(
+            input_frame,
+            text="Actual Returns",
+            command=self.show_actual_returns,
+            font=("Segoe UI", 14, "bold"),
+            height=45,
+            width=200,
+            fg_color=COLORS['primary'],
+            corner_radius=10
+        )
+        actual_button.grid(row=6, column=3, padx=20, pady=(10, 25), sticky="w")
+        
         # Results frame with light background
         self.results_frame = ctk.CTkScrollableFrame(
             self,
@@ -142,6 +331,56 @@ class SIPCalculator(ctk.CTkFrame):
         )
         placeholder.pack(pady=50)
     
+    def create_option_entry(self, parent, text, value, row, column):
+        """Add a labelled plan-option entry to the input grid"""
+        label = ctk.CTkLabel(
+            parent, 
+            text=text, 
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        )
+        label.grid(row=row, column=column, sticky="w", padx=20, pady=(20 if row == 0 else 10, 5))
+        
+        entry = ctk.CTkEntry(
+            parent, 
+            width=200,
+            height=40,
+            font=("Segoe UI", 14),
+            border_width=2,
+            border_color=COLORS['border'],
+            fg_color="white"
+        )
+        entry.grid(row=row + 1, column=column, padx=20, pady=(0, 15), sticky="w")
+        if value:
+            entry.insert(0, value)
+        return entry
+    
+    def read_plan(self):
+        """Read the step-up / lumpsum / pause / SWP options ({} for a flat SIP)
+
+        Raises ValueError for invalid options, including a withdrawal with
+        no start year.
+        """
+        plan = {}
+        step_up = float(self.step_up_entry.get() or 0)
+        if step_up:
+            plan["step_up"] = step_up
+        lumpsum = float(self.lumpsum_entry.get() or 0)
+        if lumpsum:
+            plan["lumpsum"] = lumpsum
+        pauses = parse_pauses(self.pause_entry.get())
+        if pauses:
+            plan["pauses"] = pauses
+        withdrawal = float(self.withdrawal_entry.get() or 0)
+        if withdrawal:
+            # Starting in month 1 would stop every SIP contribution; make it explicit
+            withdraw_after = float(self.withdrawal_start_entry.get() or 0)
+            if withdraw_after <= 0:
+                raise ValueError("Withdrawals need a start after year 0")
+            plan["withdrawal"] = withdrawal
+            plan["withdrawal_start"] = int(withdraw_after * 12) + 1
+        return plan
+    
     def calculate_sip(self):
         """Calculate SIP returns and display results"""
         try:
@@ -149,23 +388,24 @@ class SIPCalculator(ctk.CTkFrame):
             monthly_investment = float(self.monthly_entry.get() or 5000)
             duration_years = float(self.duration_entry.get() or 10)
             annual_return = float(self.return_entry.get() or 12)
+            plan = self.read_plan()
+            total_withdrawn = 0
             
-            # Calculate SIP
-            monthly_return = annual_return / 100 / 12
-            total_months = duration_years * 12
-            
-            # Future Value formula for SIP
-            if monthly_return > 0:
-                future_value = monthly_investment * (((1 + monthly_return) ** total_months - 1) / monthly_return) * (1 + monthly_return)
+            if plan:
+                # Step-up / lumpsum / pauses / SWP go through the cash-flow simulator
+                _, invested, withdrawn, values = simulate_plan(
+                    duration_years, annual_return, monthly_investment, **plan
+                )
+                total_invested, total_withdrawn, future_value = invested[-1], withdrawn[-1], values[-1]
+                total_returns = future_value + total_withdrawn - total_invested
             else:
-                future_value = monthly_investment * total_months
-            
-            total_invested = monthly_investment * total_months
-            total_returns = future_value - total_invested
+                # Calculate SIP (future value formula lives in finsight.core.sip)
+                total_invested, total_returns, future_value = sip_summary(
+                    monthly_investment, duration_years, annual_return
+                )
             
             # Clear results frame
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
+            self.clear_results()
             
             # Display results with Groww-style cards
             results_title = ctk.CTkLabel(
@@ -256,13 +496,26 @@ class SIPCalculator(ctk.CTkFrame):
             for i in range(3):
                 results_container.grid_columnconfigure(i, weight=1, uniform="results")
             
+            if total_withdrawn:
+                ctk.CTkLabel(
+                    self.results_frame,
+                    text=f"Withdrawn over the plan: ₹{total_withdrawn:,.0f}",
+                    font=("Segoe UI", 13),
+                    text_color=COLORS['text_secondary']
+                ).pack(pady=(5, 0))
+            
             # Create visualization
-            self.create_sip_chart(monthly_investment, duration_years, annual_return, total_invested, future_value)
+            mode = self.mode_selector.get()
+            if mode == "Constant":
+                self.create_sip_chart(monthly_investment, duration_years, annual_return, total_invested, future_value,
+                                      plan=plan)
+            else:
+                self.start_projection(mode, monthly_investment, duration_years, annual_return, total_invested, future_value,
+                                      plan)
             
         except ValueError:
             # Show error
-            for widget in self.results_frame.winfo_children():
-                widget.destroy()
+            self.clear_results()
             
             error_label = ctk.CTkLabel(
                 self.results_frame,
@@ -272,55 +525,145 @@ class SIPCalculator(ctk.CTkFrame):
             )
             error_label.pack(pady=30)
     
-    def create_sip_chart(self, monthly_investment, duration_years, annual_return, total_invested, future_value):
-        """Create SIP growth visualization chart with Groww theme"""
-        try:
-            # Create chart frame with Groww card style
-            chart_frame = ctk.CTkFrame(
-                self.results_frame, 
-                corner_radius=15, 
-                fg_color=COLORS['card_bg'],
-                border_width=2,
-                border_color=COLORS['border']
-            )
-            chart_frame.pack(pady=25, padx=20, fill="both", expand=True)
-            
-            # Chart title with Groww style
-            chart_title = ctk.CTkLabel(
-                chart_frame,
-                text="Growth Visualization",
-                font=("Segoe UI", 16, "bold"),
-                text_color=COLORS['text_primary']
+    def start_projection(self, mode, monthly_investment, duration_years, annual_return, total_invested, future_value,
+                         plan=None):
+        """Simulate return paths in the background, then chart them with percentile bands"""
+        volatility = float(self.volatility_entry.get() or 15)
+        paths = int(self.paths_menu.get())
+        workers = os.cpu_count() if paths >= POOL_PATH_THRESHOLD else 0
+        
+        self.projection_id += 1
+        projection_id = self.projection_id
+        
+        status_label = ctk.CTkLabel(
+            self.results_frame,
+            text=f"⏳ Simulating {paths:,} paths...",
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        )
+        status_label.pack(pady=30)
+        
+        def simulate():
+            history = None
+            if mode == "Historical":
+                history = MarketDataCache().monthly_returns(HISTORICAL_INDEX, HISTORICAL_YEARS)
+            return monte_carlo_sip(
+                monthly_investment, duration_years, annual_return, volatility,
+                paths=paths, history=history, workers=workers, plan=plan
             )
-            chart_title.pack(pady=(20, 10))
-            
-            # Create matplotlib figure
-            fig, ax = plt.subplots(figsize=(11, 5))
-            fig.patch.set_facecolor('#ffffff')
+        
+        def show(bands):
+            if projection_id != self.projection_id or not status_label.winfo_exists():
+                return
+            status_label.destroy()
+            self.create_sip_chart(monthly_investment, duration_years, annual_return, total_invested, future_value,
+                                  bands, plan)
+        
+        def on_error(error):
+            print(f"Error simulating SIP paths: {error}")
+            show(None)
+        
+        get_fetch_client().submit_blocking(
+            simulate,
+            on_success=lambda result: show(result[2]),
+            on_error=on_error,
+            root=self
+        )
+    
+    def create_sip_chart(self, monthly_investment, duration_years, annual_return, total_invested, future_value,
+                         bands=None, plan=None):
+        """Show the SIP growth chart for a plan, reusing one persistent figure
+
+        bands is an optional (P10, P50, P90) x years array drawn over the
+        value bars; plan holds step-up / lumpsum / pause / SWP options.
+        """
+        try:
+            if self.chart_frame is None:
+                self.build_sip_chart()
             
             # Calculate year-wise values
-            years = list(range(1, int(duration_years) + 1))
-            invested_values = [monthly_investment * 12 * year for year in years]
-            
-            monthly_return = annual_return / 100 / 12
-            future_values = []
+            if plan:
+                years, invested_values, future_values = plan_yearly_growth(
+                    duration_years, annual_return, monthly_investment, **plan
+                )
+            else:
+                years, invested_values, future_values = yearly_growth(
+                    monthly_investment, duration_years, annual_return
+                )
             
-            for year in years:
-                months = year * 12
-                if monthly_return > 0:
-                    fv = monthly_investment * (((1 + monthly_return) ** months - 1) / monthly_return) * (1 + monthly_return)
-                else:
-                    fv = monthly_investment * months
-                future_values.append(fv)
+            self.update_sip_chart(years, invested_values, future_values, bands)
+            self.chart_frame.pack(pady=25, padx=20, fill="both", expand=True)
             
-            # Set Groww-style colors
-            ax.set_facecolor('#fafbff')
+        except Exception as e:
+            print(f"Error creating SIP chart: {e}")
+    
+    def build_sip_chart(self):
+        """Create the growth chart's frame, figure, axes and canvas (once per calculator)"""
+        # Create chart frame with Groww card style
+        self.chart_frame = ctk.CTkFrame(
+            self.results_frame, 
+            corner_radius=15, 
+            fg_color=COLORS['card_bg'],
+            border_width=2,
+            border_color=COLORS['border']
+        )
+        
+        # Chart title with Groww style
+        chart_title = ctk.CTkLabel(
+            self.chart_frame,
+            text="Growth Visualization",
+            font=("Segoe UI", 16, "bold"),
+            text_color=COLORS['text_primary']
+        )
+        chart_title.pack(pady=(20, 10))
+        
+        # A plain Figure (not pyplot) so nothing is kept in pyplot's registry
+        fig = Figure(figsize=(11, 5))
+        fig.patch.set_facecolor('#ffffff')
+        ax = fig.add_subplot()
+        
+        # Styling with Groww theme
+        ax.set_facecolor('#fafbff')
+        ax.set_xlabel('Years', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
+        ax.set_ylabel('Amount (₹)', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
+        ax.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
+        ax.tick_params(colors=COLORS['text_secondary'], labelsize=10)
+        ax.grid(True, alpha=0.2, linestyle='-', linewidth=0.8, color='#e0e4f5', axis='y')
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+        ax.spines['left'].set_color(COLORS['border'])
+        ax.spines['bottom'].set_color(COLORS['border'])
+        
+        # Embed chart
+        self.chart_figure = fig
+        self.chart_axes = ax
+        self.chart_canvas = FigureCanvasTkAgg(fig, self.chart_frame)
+        self.chart_canvas.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=(5, 20))
+        
+        # Artists updated in place on every calculation
+        self.invested_bars = None
+        self.value_bars = None
+        self.band_artists = []
+    
+    def update_sip_chart(self, years, invested_values, future_values, bands=None):
+        """Update the chart artists in place and schedule a redraw"""
+        ax = self.chart_axes
+        width = 0.38
+        x_pos = np.arange(len(years))
+        
+        if self.invested_bars is not None and len(self.invested_bars) == len(years):
+            # Same number of years: just move the bar tops
+            for bar, height in zip(self.invested_bars, invested_values):
+                bar.set_height(height)
+            for bar, height in zip(self.value_bars, future_values):
+                bar.set_height(height)
+        else:
+            if self.invested_bars is not None:
+                self.invested_bars.remove()
+                self.value_bars.remove()
             
             # Plot bars with Groww colors
-            width = 0.38
-            x_pos = np.arange(len(years))
-            
-            bars1 = ax.bar(
+            self.invested_bars = ax.bar(
                 x_pos - width/2, invested_values, width, 
                 label='Invested amount', 
                 color='#d4d9ff',  # Light purple
@@ -328,7 +671,7 @@ class SIPCalculator(ctk.CTkFrame):
                 edgecolor='#5367ff',
                 linewidth=1.8
             )
-            bars2 = ax.bar(
+            self.value_bars = ax.bar(
                 x_pos + width/2, future_values, width, 
                 label='Est. returns', 
                 color='#b3f5e9',  # Light teal
@@ -336,50 +679,409 @@ class SIPCalculator(ctk.CTkFrame):
                 edgecolor='#00d09c',
                 linewidth=1.8
             )
-            
-            # Styling with Groww theme
-            ax.set_xlabel('Years', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
-            ax.set_ylabel('Amount (₹)', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
             ax.set_xticks(x_pos)
-            ax.set_xticklabels([f'{y}Y' for y in years], fontsize=10)
-            
-            # Enhanced legend with Groww style
-            legend = ax.legend(
-                loc='upper left',
-                facecolor='white', 
-                edgecolor=COLORS['border'], 
-                fontsize=11,
-                framealpha=1,
-                shadow=False
+        ax.set_xticklabels([f'{y:g}Y' for y in years], fontsize=10)
+        
+        # Simulated percentile bands over the value bars
+        for artist in self.band_artists:
+            artist.remove()
+        self.band_artists = []
+        if bands is not None:
+            self.band_artists.append(ax.fill_between(
+                x_pos + width/2, bands[0], bands[2],
+                color='#5367ff',
+                alpha=0.15,
+                label='P10 - P90'
+            ))
+            self.band_artists.extend(ax.plot(
+                x_pos + width/2, bands[1],
+                color='#5367ff',
+                marker='o',
+                markersize=4,
+                linewidth=2,
+                label='Median (P50)'
+            ))
+        
+        # Axis limits follow the data (no autoscale pass over the artists)
+        top = max(np.max(invested_values, initial=0), np.max(future_values, initial=0))
+        if bands is not None:
+            top = max(top, np.max(bands[2]))
+        ax.set_xlim(-0.6, len(years) - 0.4)
+        ax.set_ylim(0, top * 1.08 or 1)
+        
+        # Enhanced legend with Groww style
+        legend = ax.legend(
+            loc='upper left',
+            facecolor='white', 
+            edgecolor=COLORS['border'], 
+            fontsize=11,
+            framealpha=1,
+            shadow=False
+        )
+        legend.get_frame().set_linewidth(1.5)
+        
+        if not self.chart_laid_out:
+            self.chart_figure.tight_layout()
+            self.chart_laid_out = True
+        self.chart_canvas.draw_idle()
+    
+    def clear_results(self):
+        """Clear the results area, keeping the persistent growth chart for reuse"""
+        for widget in self.results_frame.winfo_children():
+            if widget is self.chart_frame:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+    
+    def show_scenario_grid(self):
+        """Show a heatmap of final corpus over monthly amounts x durations, per return rate"""
+        try:
+            monthly_investment = float(self.monthly_entry.get() or 5000)
+            duration_years = float(self.duration_entry.get() or 10)
+            annual_return = float(self.return_entry.get() or 12)
+        except ValueError:
+            monthly_investment, duration_years, annual_return = 5000, 10, 12
+        
+        # Whole grid in one broadcast; the rate slider only swaps slices
+        grid = ScenarioGrid(SCENARIO_AMOUNTS, SCENARIO_DURATIONS, SCENARIO_RATES)
+        rate_index = grid.nearest("rate", annual_return)
+        
+        # Clear results frame
+        self.clear_results()
+        
+        try:
+            grid_frame = ctk.CTkFrame(
+                self.results_frame,
+                corner_radius=15,
+                fg_color=COLORS['card_bg'],
+                border_width=2,
+                border_color=COLORS['border']
             )
-            legend.get_frame().set_linewidth(1.5)
-            
-            # Format y-axis
-            def format_currency(x, p):
-                if x >= 10000000:  # 1 Crore
-                    return f'₹{x/10000000:.1f}Cr'
-                elif x >= 100000:  # 1 Lakh
-                    return f'₹{x/100000:.1f}L'
-                elif x >= 1000:
-                    return f'₹{x/1000:.0f}K'
-                else:
-                    return f'₹{x:.0f}'
+            grid_frame.pack(pady=25, padx=20, fill="both", expand=True)
             
+            grid_title = ctk.CTkLabel(
+                grid_frame,
+                text="Scenario Grid - Final Corpus",
+                font=("Segoe UI", 16, "bold"),
+                text_color=COLORS['text_primary']
+            )
+            grid_title.pack(pady=(20, 5))
+            
+            rate_label = ctk.CTkLabel(
+                grid_frame,
+                text="",
+                font=("Segoe UI", 13),
+                text_color=COLORS['text_secondary']
+            )
+            rate_label.pack(pady=(0, 5))
+            
+            rate_slider = ctk.CTkSlider(
+                grid_frame,
+                from_=0,
+                to=len(grid.rates) - 1,
+                number_of_steps=len(grid.rates) - 1,
+                button_color=COLORS['primary'],
+                progress_color=COLORS['primary']
+            )
+            rate_slider.set(rate_index)
+            rate_slider.pack(pady=(0, 10), padx=40, fill="x")
+            
+            fig = Figure(figsize=(11, 5))
+            fig.patch.set_facecolor('#ffffff')
+            ax = fig.add_subplot()
+            
+            # Durations across, monthly amounts up
+            image = ax.imshow(
+                grid.values[:, :, rate_index],
+                aspect='auto',
+                origin='lower',
+                cmap='viridis',
+                extent=(
+                    grid.durations[0] - 0.5, grid.durations[-1] + 0.5,
+                    grid.amounts[0], grid.amounts[-1]
+                )
+            )
+            colorbar = fig.colorbar(image, ax=ax)
+            colorbar.formatter = plt.FuncFormatter(format_currency)
+            colorbar.update_ticks()
+            
+            # Mark the plan currently entered in the form
+            ax.plot(duration_years, monthly_investment, marker='*', markersize=14, color='#ff6b6b')
+            
+            ax.set_xlabel('Years', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
+            ax.set_ylabel('Monthly Investment (₹)', color=COLORS['text_primary'], fontsize=12, fontweight='600', labelpad=10)
             ax.yaxis.set_major_formatter(plt.FuncFormatter(format_currency))
             ax.tick_params(colors=COLORS['text_secondary'], labelsize=10)
-            ax.grid(True, alpha=0.2, linestyle='-', linewidth=0.8, color='#e0e4f5', axis='y')
-            ax.spines['top'].set_visible(False)
-            ax.spines['right'].set_visible(False)
-            ax.spines['left'].set_color(COLORS['border'])
-            ax.spines['bottom'].set_color(COLORS['border'])
             
-            # Tight layout
             fig.tight_layout()
             
-            # Embed chart
-            canvas = FigureCanvasTkAgg(fig, chart_frame)
-            canvas.draw()
+            canvas = FigureCanvasTkAgg(fig, grid_frame)
             canvas.get_tk_widget().pack(fill="both", expand=True, padx=20, pady=(5, 20))
             
+            def show_rate(value):
+                index = int(round(float(value)))
+                rate = grid.rates[index]
+                data = grid.values[:, :, index]
+                image.set_data(data)
+                image.set_clim(data.min(), data.max())
+                rate_label.configure(text=f"Return rate: {rate:.1f}% p.a.")
+                canvas.draw_idle()
+            
+            rate_slider.configure(command=show_rate)
+            show_rate(rate_index)
+            
         except Exception as e:
-            print(f"Error creating SIP chart: {e}")
+            print(f"Error creating scenario grid: {e}")
+    
+    def show_goal_seek(self):
+        """Show the goal-seek panel: solve for amount, rate or duration from a target corpus"""
+        # Clear results frame
+        self.clear_results()
+        
+        goal_frame = ctk.CTkFrame(
+            self.results_frame,
+            corner_radius=15,
+            fg_color=COLORS['card_bg'],
+            border_width=2,
+            border_color=COLORS['border']
+        )
+        goal_frame.pack(pady=25, padx=20, fill="x")
+        goal_frame.grid_columnconfigure(2, weight=1)
+        
+        ctk.CTkLabel(
+            goal_frame,
+            text="🎯 Goal Seek",
+            font=("Segoe UI", 16, "bold"),
+            text_color=COLORS['text_primary']
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=20, pady=(20, 10))
+        
+        self.target_entry = self.create_option_entry(goal_frame, "Target Corpus (₹, today's money)", "10000000", 1, 0)
+        self.inflation_entry = self.create_option_entry(goal_frame, "Inflation (% p.a.)", "0", 1, 1)
+        
+        ctk.CTkLabel(
+            goal_frame,
+            text="Solve For",
+            font=("Segoe UI", 13),
+            text_color=COLORS['text_secondary']
+        ).grid(row=3, column=0, sticky="w", padx=20, pady=(10, 5))
+        
+        self.solve_for = ctk.CTkSegmentedButton(
+            goal_frame,
+            values=GOAL_TARGETS,
+            font=("Segoe UI", 13),
+            selected_color=COLORS['primary']
+        )
+        self.solve_for.grid(row=4, column=0, columnspan=2, padx=20, pady=(0, 15), sticky="w")
+        self.solve_for.set(GOAL_TARGETS[0])
+        
+        solve_button = ctk.CTkButton(
+            goal_frame,
+            text="Solve",
+            command=self.solve_goal,
+            font=("Segoe UI", 14, "bold"),
+            height=40,
+            width=200,
+            fg_color=COLORS['secondary'],
+            hover_color="#00b87c",
+            corner_radius=10
+        )
+        solve_button.grid(row=5, column=0, padx=20, pady=(5, 15), sticky="w")
+        
+        self.goal_result_label = ctk.CTkLabel(
+            goal_frame,
+            text="The other inputs above are used as given",
+            font=("Segoe UI", 18, "bold"),
+            text_color=COLORS['text_secondary'],
+            justify="left"
+        )
+        self.goal_result_label.grid(row=6, column=0, columnspan=3, sticky="w", padx=20, pady=(5, 25))
+    
+    def solve_goal(self):
+        """Solve the selected unknown and show it"""
+        try:
+            target = float(self.target_entry.get())
+            inflation = float(self.inflation_entry.get() or 0)
+            monthly_investment = float(self.monthly_entry.get() or 5000)
+            duration_years = float(self.duration_entry.get() or 10)
+            annual_return = float(self.return_entry.get() or 12)
+            plan = self.read_plan()
+        except ValueError:
+            self.goal_result_label.configure(text="Please enter valid numbers", text_color=("red", "#ff6b6b"))
+            return
+        
+        solve_for = self.solve_for.get()
+        if solve_for == "Monthly Amount":
+            solved = required_monthly(target, duration_years, annual_return, inflation, **plan)
+            text = f"Invest ₹{solved:,.0f}/month for {duration_years:g} years at {annual_return:g}%"
+        elif solve_for == "Return Rate":
+            solved = required_rate(target, monthly_investment, duration_years, inflation, **plan)
+            text = f"Needs {solved:.2f}% p.a. on ₹{monthly_investment:,.0f}/month for {duration_years:g} years"
+        else:
+            solved = required_years(target, monthly_investment, annual_return, inflation, **plan)
+            duration_years = solved
+            text = f"Takes {solved:.1f} years at ₹{monthly_investment:,.0f}/month and {annual_return:g}%"
+        
+        solved = not np.isnan(solved)
+        if not solved:
+            text = "This goal can't be reached with these inputs"
+        elif inflation:
+            text += f"\n(target is ₹{inflation_adjusted(target, duration_years, inflation):,.0f} in money of that year)"
+        self.goal_result_label.configure(
+            text=text,
+            text_color=COLORS['primary'] if solved else ("red", "#ff6b6b")
+        )
+    
+    def show_actual_returns(self):
+        """Show the actual-returns panel: XIRR of dated investments and redemptions"""
+        # Clear results frame
+        self.clear_results()
+        
+        returns_frame = ctk.CTkFrame(
+            self.results_frame,
+            corner_radius=15,
+            fg_color=COLORS['card_bg'],
+            border_width=2,
+            border_color=COLORS['border']
+        )
+        returns_frame.pack(pady=25, padx=20, fill="x")
+        returns_frame.grid_columnconfigure(2, weight=1)
+        
+        ctk.CTkLabel(
+            returns_frame,
+            text="📈 Actual Returns (XIRR)",
+            font=("Segoe UI", 16, "bold"),
+            text_color=COLORS['text_primary']
+        ).grid(row=0, column=0, columnspan=3, sticky="w", padx=20, pady=(20, 5))
+        
+        ctk.CTkLabel(
+            returns_frame,
+            text="One cash flow per line: date, amount (redemptions negative)",
+            font=("Segoe UI", 12),
+            text_color=COLORS['text_secondary']
+        ).grid(row=1, column=0, columnspan=3, sticky="w", padx=20, pady=(0, 5))
+        
+        self.cashflow_box = ctk.CTkTextbox(
+            returns_frame,
+            height=180,
+            font=("Consolas", 13),
+            border_width=2,
+            border_color=COLORS['border'],
+            fg_color="white"
+        )
+        self.cashflow_box.grid(row=2, column=0, columnspan=3, padx=20, pady=(0, 10), sticky="ew")
+        
+        # Start from the form's SIP amount over the last year as an example
+        monthly_investment = self.monthly_entry.get() or "5000"
+        today = date.today()
+        this_month = np.datetime64(today, "M")
+        example = [
+            f"{np.datetime64(month, 'D')}, {monthly_investment}"
+            for month in np.arange(this_month - 12, this_month)
+        ]
+        self.cashflow_box.insert("1.0", "\n".join(example))
+        
+        self.current_value_entry = self.create_option_entry(returns_frame, "Current Value (₹)", "", 3, 0)
+        self.valuation_date_entry = self.create_option_entry(returns_frame, "Valuation Date", today.isoformat(), 3, 1)
+        
+        calc_button = ctk.CTkButton(
+            returns_frame,
+            text="Calculate XIRR",
+            command=self.calculate_actual_returns,
+            font=("Segoe UI", 14, "bold"),
+            height=40,
+            width=200,
+            fg_color=COLORS['secondary'],
+            hover_color="#00b87c",
+            corner_radius=10
+        )
+        calc_button.grid(row=5, column=0, padx=20, pady=(5, 15), sticky="w")
+        
+        self.actual_result_label = ctk.CTkLabel(
+            returns_frame,
+            text="",
+            font=("Segoe UI", 16, "bold"),
+            text_color=COLORS['primary'],
+            justify="left"
+        )
+        self.actual_result_label.grid(row=6, column=0, columnspan=3, sticky="w", padx=20, pady=(5, 25))
+    
+    def calculate_actual_returns(self):
+        """Compute XIRR (and CAGR for a single investment) of the entered cash flows"""
+        try:
+            dates, amounts = parse_cashflows(self.cashflow_box.get("1.0", "end"))
+            current_value = float(self.current_value_entry.get() or 0)
+            valuation_date = date.fromisoformat(self.valuation_date_entry.get().strip())
+        except ValueError as e:
+            self.actual_result_label.configure(text=f"Please check the cash flows: {e}", text_color=("red", "#ff6b6b"))
+            return
+        
+        # XIRR sign convention: money in is negative, money out (and the current value) positive
+        flow_dates = np.array(dates + [valuation_date], dtype="datetime64[D]")
+        flows = np.append(-np.array(amounts), current_value)
+        rate = xirr(flows, year_fractions(flow_dates))
+        
+        invested = sum(amount for amount in amounts if amount > 0)
+        redeemed = -sum(amount for amount in amounts if amount < 0)
+        gain = current_value + redeemed - invested
+        
+        if np.isnan(rate):
+            text = "XIRR can't be computed for these cash flows"
+        else:
+            text = f"XIRR: {rate:.2f}% p.a."
+            if len(amounts) == 1 and amounts[0] > 0 and valuation_date > dates[0]:
+                years = (valuation_date - dates[0]).days / 365
+                text += f"   |   CAGR: {cagr(amounts[0], current_value, years):.2f}%"
+        text += (f"\nInvested ₹{invested:,.0f}, redeemed ₹{redeemed:,.0f}, "
+                 f"current value ₹{current_value:,.0f} - gain ₹{gain:,.0f}")
+        self.actual_result_label.configure(
+            text=text,
+            text_color=COLORS['primary'] if not np.isnan(rate) else ("red", "#ff6b6b")
+        )
+
+
+# Memory regression check: 1,000 Calculate clicks must not grow memory or figures
+if __name__ == "__main__":
+    import gc
+    import sys
+    import tracemalloc
+    
+    CLICKS = 1000
+    MAX_GROWTH_MB = 10
+    
+    root = ctk.CTk()
+    root.withdraw()
+    calculator = SIPCalculator(root)
+    calculator.pack(fill="both", expand=True)
+    
+    def click(i):
+        calculator.monthly_entry.delete(0, "end")
+        calculator.monthly_entry.insert(0, str(1000 + i * 10))
+        calculator.duration_entry.delete(0, "end")
+        calculator.duration_entry.insert(0, str(5 + i % 20))
+        calculator.calculate_sip()
+        root.update()
+    
+    def widget_count(widget):
+        return 1 + sum(widget_count(child) for child in widget.winfo_children())
+    
+    # Warm up caches (fonts, text layout) before measuring
+    for i in range(50):
+        click(i)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    widgets = widget_count(root)
+    
+    for i in range(CLICKS):
+        click(i)
+    gc.collect()
+    growth_mb = (tracemalloc.get_traced_memory()[0] - baseline) / 1e6
+    final_widgets = widget_count(root)
+    
+    print(f"{CLICKS} clicks: Python heap {growth_mb:+.2f} MB, "
+          f"pyplot figures {len(plt.get_fignums())}, widgets {widgets} -> {final_widgets}")
+    root.destroy()
+    
+    if growth_mb > MAX_GROWTH_MB or plt.get_fignums() or final_widgets != widgets:
+        print("Memory regression!")
+        sys.exit(1)
@@ -0,0 +1,148 @@
+"""
+Virtual Grid Module
+Description: Scrollable grid/list that only creates widgets for the rows in
+view and recycles them while scrolling, so large lists stay fast
+"""
+
+import math
+import tkinter as tk
+
+import customtkinter as ctk
+
+
+class VirtualGrid(ctk.CTkFrame):
+    """Virtualized grid of fixed-height cells on a single Tk canvas
+
+    create_cell(parent) builds one cell widget and bind_cell(cell, item)
+    fills it for an item. Only enough cells to cover the visible rows (plus
+    one spare row) are ever created; scrolling moves them to the new rows
+    and rebinds them, so widget count and layout cost stay flat as the item
+    list grows. Use columns=1 for a plain list.
+    """
+
+    def __init__(self, parent, create_cell, bind_cell, row_height=90, columns=3,
+                 height=300, cell_padding=5, **kwargs):
+        super().__init__(parent, height=height, **kwargs)
+        self.create_cell = create_cell
+        self.bind_cell = bind_cell
+        self.row_height = row_height
+        self.columns = columns
+        self.cell_padding = cell_padding
+
+        self.items = []
+        self._cells = []  # (canvas window id, cell widget), row-major by slot
+        self._first_row = None
+        self._cell_width = 1
+
+        self.canvas = tk.Canvas(
+            self,
+            height=height,
+            highlightthickness=0,
+            borderwidth=0,
+            bg=self._apply_appearance_mode(self.cget("fg_color")),
+            yscrollincrement=max(row_height // 3, 1)
+        )
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 2), pady=2)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=2, pady=2)
+
+        self.canvas.bind("<Configure>", lambda event: self._layout())
+        self._bind_mousewheel(self.canvas)
+
+    def _bind_mousewheel(self, widget):
+        """Scroll the grid from anywhere over it (cells included)"""
+        # Plain Tk bind (CTk widgets override bind and forward it to their parts)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            tk.Misc.bind(widget, sequence, self._on_mousewheel, "+")
+        for child in widget.winfo_children():
+            self._bind_mousewheel(child)
+
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            self.canvas.yview_scroll(-1, "units")
+        else:
+            self.canvas.yview_scroll(1, "units")
+        self._render()
+        # Keep an enclosing scrollable frame from scrolling too
+        return "break"
+
+    def _on_scrollbar(self, *args):
+        self.canvas.yview(*args)
+        self._render()
+
+    def _visible_rows(self):
+        return max(self.canvas.winfo_height(), self.row_height) // self.row_height + 2
+
+    def _layout(self):
+        """Size the cell pool and scroll region to the current canvas size"""
+        width = max(self.canvas.winfo_width(), 1)
+        self._cell_width = width / self.columns
+
+        # Grow the pool to cover the viewport; extra cells are just hidden
+        needed = self._visible_rows() * self.columns
+        while len(self._cells) < needed:
+            cell = self.create_cell(self.canvas)
+            window_id = self.canvas.create_window(0, 0, window=cell, anchor="nw", state="hidden")
+            self._bind_mousewheel(cell)
+            self._cells.append((window_id, cell))
+
+        for window_id, _ in self._cells:
+            self.canvas.itemconfigure(
+                window_id,
+                width=max(int(self._cell_width) - 2 * self.cell_padding, 1),
+                height=self.row_height - 2 * self.cell_padding
+            )
+
+        total_rows = math.ceil(len(self.items) / self.columns)
+        self.canvas.configure(scrollregion=(0, 0, width, total_rows * self.row_height))
+        self._render(force=True)
+
+    def _render(self, force=False):
+        """Move the cell pool to the rows in view and bind their items"""
+        first_row = max(int(self.canvas.canvasy(0) // self.row_height), 0)
+        if first_row == self._first_row and not force:
+            return
+        self._first_row = first_row
+
+        for slot, (window_id, cell) in enumerate(self._cells):
+            row = first_row + slot // self.columns
+            col = slot % self.columns
+            index = row * self.columns + col
+            if index >= len(self.items):
+                # Park unused cells off-canvas as well as hiding them
+                self.canvas.itemconfigure(window_id, state="hidden")
+                self.canvas.coords(window_id, -10000, -10000)
+                continue
+            self.canvas.coords(
+                window_id,
+                col * self._cell_width + self.cell_padding,
+                row * self.row_height + self.cell_padding
+            )
+            self.canvas.itemconfigure(window_id, state="normal")
+            self.bind_cell(cell, self.items[index])
+
+    def set_items(self, items):
+        """Replace the items shown by the grid"""
+        self.items = list(items)
+        self._layout()
+
+    def refresh(self, items=None):
+        """Rebind the visible cells (e.g. after their items' data changed)
+
+        With items, only the visible cells showing one of those items are
+        rebound.
+        """
+        if items is None or self._first_row is None:
+            self._render(force=True)
+            return
+        items = set(items)
+        for slot, (_, cell) in enumerate(self._cells):
+            index = (self._first_row + slot // self.columns) * self.columns + slot % self.columns
+            if index < len(self.items) and self.items[index] in items:
+                self.bind_cell(cell, self.items[index])
+
+    def cell_count(self):
+        """Number of cell widgets created so far"""
+        return len(self._cells)
@@ -0,0 +1,76 @@
+"""
+Watchlist Module
+Description: User-configurable list of ticker symbols shown on the dashboard,
+saved as JSON in the local data directory
+"""
+
+import json
+import os
+
+from config import DATA_DIR
+
+DEFAULT_WATCHLIST = ["AAPL", "GOOGL", "MSFT", "TSLA", "AMZN", "NVDA"]
+DEFAULT_WATCHLIST_PATH = os.path.join(DATA_DIR, "watchlist.json")
+
+
+class Watchlist:
+    """Ordered, de-duplicated list of ticker symbols"""
+
+    def __init__(self, path=DEFAULT_WATCHLIST_PATH):
+        self.path = path
+        self.symbols = self.load()
+
+    def load(self):
+        """Read the saved watchlist, or the default one if none was saved"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                symbols = json.load(f)
+            return self._normalize(symbols)
+        except (OSError, ValueError):
+            return list(DEFAULT_WATCHLIST)
+
+    def save(self):
+        """Write the watchlist to disk"""
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(self.symbols, f)
+        except OSError as e:
+            print(f"Error saving watchlist: {e}")
+
+    @staticmethod
+    def _normalize(symbols):
+        seen = set()
+        result = []
+        for symbol in symbols:
+            symbol = str(symbol).strip().upper()
+            if symbol and symbol not in seen:
+                seen.add(symbol)
+                result.append(symbol)
+        return result
+
+    def add(self, *symbols):
+        """Add symbols (comma or space separated strings are split) and return the new ones"""
+        candidates = self._normalize(
+            part for text in symbols for part in str(text).replace(",", " ").split()
+        )
+        added = [symbol for symbol in candidates if symbol not in self.symbols]
+        if added:
+            self.symbols.extend(added)
+            self.save()
+        return added
+
+    def remove(self, symbol):
+        """Remove a symbol; returns True if it was in the watchlist"""
+        symbol = symbol.strip().upper()
+        if symbol not in self.symbols:
+            return False
+        self.symbols.remove(symbol)
+        self.save()
+        return True
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __iter__(self):
+        return iter(self.symbols)